@@ -11,33 +11,265 @@ small adapter objects to keep the orchestration logic thin and testable.
 
 from __future__ import annotations
 
+import asyncio
+import copy
 import json
 import re
-from dataclasses import dataclass
-from typing import Any, Protocol, Sequence
-
+import string
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from concurrent.futures import Executor, Future
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Protocol
+
+from src.core import json_utils
 from src.core.observability import QueryObservationSink
 from src.core.record_utils import (
+    DEFAULT_CONTEXT_COLUMNS,
     build_record_context,
     extract_candidate_urls,
+    scan_record,
 )
 from src.integrations.openai_agent_sdk import OpenAIAgentAdapter
 
 TOKEN_MIN_LENGTH = 3
+PROMPT_VALUE_LIMIT = 512
+_COLUMN_SELECTION_CACHE_SIZE = 1024
+# A lone uncached record is cheaper to fetch on demand than through an IN list.
+_MIN_PREFETCH_BATCH = 2
+
+_CONTAINER_TYPES = (list, tuple, set, frozenset, dict)
+
+_NON_ALNUM_RE = re.compile(r"[^a-z0-9\s]")
+_WS_RE = re.compile(r"\s+")
+_NON_UPPER_ALNUM_RE = re.compile(r"[^A-Z0-9]+")
+_NON_LOWER_ALNUM_RE = re.compile(r"[^a-z0-9]+")
+_JSON_START_RE = re.compile(r"[\[{]")
+_JSON_DECODER = json.JSONDecoder()
+# ASCII counterpart of _NON_ALNUM_RE for str.translate.
+_ASCII_NORMALIZE_TABLE = str.maketrans(
+    {
+        char: " "
+        for char in map(chr, range(128))
+        if not (char.isspace() or char in string.ascii_lowercase or char in string.digits)
+    }
+)
+
+
+@lru_cache(maxsize=4096)
+def _normalize_text(text: str) -> str:
+    # Column names repeat across rows, agents and facts, so memoising beats
+    # re-running translate/split for every call.
+    lowered = text.lower()
+    if lowered.isascii():
+        return " ".join(lowered.translate(_ASCII_NORMALIZE_TABLE).split())
+    return _WS_RE.sub(" ", _NON_ALNUM_RE.sub(" ", lowered)).strip()
+
+
+@lru_cache(maxsize=512)
+def _canonical_concept(concept: str) -> str:
+    lowered = concept.strip().lower()
+    if not lowered:
+        return ""
+    return _NON_LOWER_ALNUM_RE.sub("_", lowered).strip("_")
+
 
-DEFAULT_SYNONYMS: dict[str, set[str]] = {
-    "BUSINESS_NAME": {"business name", "name"},
-    "LOCATION_CITY": {"city"},
-    "RECORD_STATUS": {"status"},
-    "LOCATION_STATE_CODE": {"state", "state code"},
-    "LOCATION_COUNTRY": {"country"},
+@lru_cache(maxsize=512)
+def _concept_for_column(column: str) -> str:
+    # Called for every emitted fact with a small, repeating set of column names.
+    normalized = _normalize_text(column)
+    if not normalized:
+        return column.strip().lower()
+    return normalized.replace(" ", "_")
+
+
+def _iter_json_dicts(value: Any) -> Iterator[dict[str, Any]]:
+    # Payloads arrive either as one object or as a list of them.
+    if isinstance(value, dict):
+        yield value
+    elif isinstance(value, list):
+        yield from (item for item in value if isinstance(item, dict))
+
+
+DEFAULT_SYNONYMS: dict[str, frozenset[str]] = {
+    "BUSINESS_NAME": frozenset({"business name", "name"}),
+    "LOCATION_CITY": frozenset({"city"}),
+    "RECORD_STATUS": frozenset({"status"}),
+    "LOCATION_STATE_CODE": frozenset({"state", "state code"}),
+    "LOCATION_COUNTRY": frozenset({"country"}),
 }
 
+_TRIE_TERMINAL = ""
+
+
+@dataclass(slots=True)
+class _SynonymIndex:
+    """Character trie over every column synonym phrase of a single schema.
+
+    A compiled alternation of all phrases locates the offsets where any phrase
+    starts in one C-level scan; the trie is only walked from those offsets so
+    overlapping phrases (``state`` and ``state code``) are all reported.
+
+    ``token_positions`` inverts ``column_tokens`` so wide schemas only touch the
+    columns that share at least one token with the question.
+    """
+
+    columns: tuple[str, ...]
+    column_tokens: tuple[frozenset[str], ...]
+    token_positions: dict[str, list[int]] = field(init=False, default_factory=dict)
+    _root: dict[str, Any] = field(init=False, default_factory=dict)
+    _phrases: set[str] = field(init=False, default_factory=set)
+    _starts: re.Pattern[str] | None = field(init=False, default=None)
+
+    def __post_init__(self) -> None:
+        for position, tokens in enumerate(self.column_tokens):
+            for token in tokens:
+                self.token_positions.setdefault(token, []).append(position)
+
+    def token_matches(self, text_tokens: frozenset[str]) -> set[int]:
+        """Return positions of columns whose every token appears in *text_tokens*.
+
+        Counting hits through ``token_positions`` replaces a per-column subset
+        test, and only columns sharing a token with the text are ever touched.
+        """
+
+        counts: dict[int, int] = {}
+        for token in text_tokens:
+            for position in self.token_positions.get(token, ()):
+                counts[position] = counts.get(position, 0) + 1
+        column_tokens = self.column_tokens
+        return {
+            position for position, count in counts.items() if count == len(column_tokens[position])
+        }
+
+    def add(self, phrase: str, position: int) -> None:
+        node = self._root
+        for char in phrase:
+            node = node.setdefault(char, {})
+        node.setdefault(_TRIE_TERMINAL, []).append(position)
+        self._phrases.add(phrase)
+        self._starts = None
+
+    def matches(self, text: str) -> set[int]:
+        """Return the positions of columns whose phrases occur within *text*."""
+
+        hits: set[int] = set()
+        if not self._phrases:
+            return hits
+        if self._starts is None:
+            ordered = sorted(self._phrases, key=len, reverse=True)
+            self._starts = re.compile(f"(?=(?:{'|'.join(map(re.escape, ordered))}))")
+        length = len(text)
+        for match in self._starts.finditer(text):
+            start = match.start()
+            node = self._root.get(text[start])
+            index = start + 1
+            while node is not None:
+                terminal = node.get(_TRIE_TERMINAL)
+                if terminal:
+                    hits.update(terminal)
+                if index >= length:
+                    break
+                node = node.get(text[index])
+                index += 1
+        return hits
+
+
+@dataclass(slots=True)
+class _StreamedResponse:
+    """Minimal response object wrapping text collected from a streamed LLM call."""
+
+    output_text: str
+
+
+@dataclass(slots=True)
+class _JsonValueScanner:
+    """Incrementally split streamed text into complete top-level JSON containers.
+
+    Each character is inspected once, so scanning a whole response stays linear
+    in its length no matter how many chunks it arrives in.
+    """
+
+    _depth: int = 0
+    _in_string: bool = False
+    _escaped: bool = False
+    _pieces: list[str] = field(default_factory=list)
+
+    def feed(self, chunk: str) -> list[str]:
+        """Consume *chunk* and return the text of every container it completes."""
+
+        completed: list[str] = []
+        start: int | None = 0 if self._depth else None
+        for index, char in enumerate(chunk):
+            if not self._depth:
+                if char in "{[":
+                    self._depth = 1
+                    start = index
+                continue
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif char == "\\":
+                    self._escaped = True
+                elif char == '"':
+                    self._in_string = False
+                continue
+            if char == '"':
+                self._in_string = True
+            elif char in "{[":
+                self._depth += 1
+            elif char in "}]":
+                self._depth -= 1
+                if not self._depth:
+                    self._pieces.append(chunk[start : index + 1])
+                    completed.append("".join(self._pieces))
+                    self._pieces.clear()
+                    start = None
+        if start is not None:
+            self._pieces.append(chunk[start:])
+        return completed
+
+
+# Synonym indexes and column lookups are pure functions of the column names, so
+# they are shared by every agent instance (the runner builds a fresh agent per
+# ticket). Schemas rarely change; the cap only guards against unbounded growth.
+_SCHEMA_CACHE_LIMIT = 32
+_SYNONYM_INDEXES: dict[tuple[str, ...], _SynonymIndex] = {}
+_COLUMN_LOOKUPS: dict[frozenset[str], dict[str, str]] = {}
+
+
 class SQLExecutor(Protocol):
     """Abstracts a SQL execution engine (e.g., Codex interpreter)."""
 
-    def run(self, statement: str) -> list[dict[str, Any]]:  # pragma: no cover - interface
-        """Execute a SQL statement and return row dictionaries."""
+    def run(
+        self, statement: str, parameters: Sequence[Any] = ()
+    ) -> list[dict[str, Any]]:  # pragma: no cover - interface
+        """Execute a SQL statement, binding ``?`` placeholders to *parameters*."""
+
+
+# (record_id, normalised question, row version) identifying a cached answer.
+AnswerCacheKey = tuple[str, str, int]
+
+# LLM column selections keyed by normalised question and column list.
+ColumnSelectionCache = dict[tuple[str, tuple[str, ...]], list[str]]
+
+
+class AnswerCache(Protocol):
+    """Stores answered results so repeat questions skip column selection and the LLM."""
+
+    def get(self, key: AnswerCacheKey) -> dict[str, Any] | None:  # pragma: no cover - interface
+        ...
+
+    def put(
+        self, key: AnswerCacheKey, value: dict[str, Any]
+    ) -> None:  # pragma: no cover - interface
+        ...
+
+    def invalidate(self, record_id: str) -> None:  # pragma: no cover - interface
+        ...
 
 
 class MissingDataFlagger(Protocol):
@@ -63,12 +295,28 @@ class QueryAgent:
     candidate_url_fields: list[str] | None = None
     context_columns: list[str] | None = None
     dataset_columns: list[str] | None = None
+    max_concurrency: int = 8
+    row_cache_size: int = 64
+    row_cache_ttl: float | None = 300.0
+    answer_cache: AnswerCache | None = None
+    # Pass a shared mapping so recurring questions across records (and agents,
+    # which are built per question) skip the selection round trip.
+    column_selection_cache: ColumnSelectionCache = field(default_factory=dict, repr=False)
+    prompt_column_limit: int = 40
+    llm_executor: Executor | None = None
 
     def __post_init__(self) -> None:
-        # Cache the last fetched row so follow-up stages can reuse it without
-        # issuing duplicate SQL queries.
-        self._last_row: dict[str, Any] | None = None
-        self._last_record_id: str | None = None
+        # LRU of recently fetched rows so repeat questions and follow-up stages
+        # reuse them without issuing duplicate SQL queries. Values are
+        # (monotonic fetch time, row); the lock keeps concurrent callers safe.
+        self._row_cache: OrderedDict[str, tuple[float, dict[str, Any]]] = OrderedDict()
+        self._row_cache_lock = threading.Lock()
+        # The point-lookup text never changes for an agent; building it once keeps
+        # every call byte-identical for executor statement and plan caches.
+        self._select_statement = self._build_select_statement()
+        # Serialized prompt context of the last row, keyed by the row object and
+        # column projection, so retries and follow-ups skip re-encoding it.
+        self._row_json_cache: tuple[dict[str, Any], tuple[str, ...] | None, str] | None = None
 
     def answer_question(self, *, ticket_id: str, question: str, record_id: str) -> dict[str, Any]:
         """Return a structured answer for the provided question."""
@@ -80,10 +328,6 @@ class QueryAgent:
         )
 
         row = self._fetch_record(ticket_id, record_id)
-        self._last_row = row
-        self._last_record_id = record_id
-        candidate_urls = extract_candidate_urls(row, self.candidate_url_fields)
-        record_context = build_record_context(row, self.context_columns)
         if row is None:
             self._flag_missing(
                 ticket_id, question, {"reason": "record_not_found", "record_id": record_id}
@@ -93,7 +337,7 @@ class QueryAgent:
                 "record_id": record_id,
                 "question": question,
                 "status": "record_not_found",
-                "candidate_urls": candidate_urls,
+                "candidate_urls": [],
             }
             self._log_event(
                 ticket_id,
@@ -102,7 +346,21 @@ class QueryAgent:
             )
             return result
 
+        cache_key, cached = self._lookup_cached_answer(ticket_id, question, record_id, row)
+        if cached is not None:
+            self._log_event(
+                ticket_id,
+                "question_resolved",
+                {"record_id": record_id, "status": cached["status"]},
+            )
+            return cached
+
+        # Cache hits and missing records never use these, so scan the row only here.
+        candidate_urls, record_context = scan_record(
+            row, self.candidate_url_fields, self.context_columns
+        )
         available_columns = self._list_available_columns(row)
+        speculation = self._speculate_facts(ticket_id, question, row, available_columns)
         columns = self._select_columns(
             ticket_id=ticket_id,
             question=question,
@@ -115,6 +373,7 @@ class QueryAgent:
             {"record_id": record_id, "columns": columns},
         )
         if not columns:
+            self._discard_speculation(ticket_id, speculation)
             facts = {"reason": "unknown_question"}
             if candidate_urls:
                 facts["candidate_urls"] = candidate_urls
@@ -136,7 +395,7 @@ class QueryAgent:
             )
             return result
 
-        facts = self._resolve_facts(ticket_id, question, row, columns)
+        facts = self._resolve_facts(ticket_id, question, row, columns, speculation)
         if not facts:
             missing_details = {"reason": "missing_values", "missing_columns": columns}
             if candidate_urls:
@@ -163,7 +422,7 @@ class QueryAgent:
         self._log_event(
             ticket_id,
             "facts_ready",
-            {
+            lambda: {
                 "record_id": record_id,
                 "concepts": [fact.get("concept") for fact in facts],
             },
@@ -181,6 +440,10 @@ class QueryAgent:
             result["answer_origin"] = answer_origin
         if record_context:
             result["record_context"] = record_context
+        if cache_key is not None:
+            # Only answered results are cached: other outcomes trigger enrichment
+            # side effects that must run again on the next ask.
+            self.answer_cache.put(cache_key, copy.deepcopy(result))
         self._log_event(
             ticket_id,
             "question_resolved",
@@ -188,6 +451,26 @@ class QueryAgent:
         )
         return result
 
+    def _lookup_cached_answer(
+        self, ticket_id: str, question: str, record_id: str, row: dict[str, Any]
+    ) -> tuple[AnswerCacheKey | None, dict[str, Any] | None]:
+        """Return the answer cache key for *row* and any answer stored under it."""
+
+        if self.answer_cache is None:
+            return None, None
+        row_version = self._row_version(row)
+        if row_version is None:
+            return None, None
+        cache_key = (record_id, self._normalize(question), row_version)
+        cached = self.answer_cache.get(cache_key)
+        if cached is None:
+            return cache_key, None
+        self._log_event(ticket_id, "answer_cache_hit", {"record_id": record_id})
+        result = copy.deepcopy(cached)
+        result["ticket_id"] = ticket_id
+        result["question"] = question
+        return cache_key, result
+
     def incorporate_scraper_findings(
         self,
         *,
@@ -216,11 +499,7 @@ class QueryAgent:
             )
             return None
 
-        row = self._get_cached_row(record_id)
-        if row is None:
-            row = self._fetch_record(ticket_id, record_id)
-            self._last_row = row
-            self._last_record_id = record_id
+        row = self._fetch_record(ticket_id, record_id)
 
         candidate_urls = extract_candidate_urls(row, self.candidate_url_fields)
         context = record_context or build_record_context(row, self.context_columns)
@@ -238,8 +517,17 @@ class QueryAgent:
             {"question": question, "finding_count": len(findings)},
         )
 
+        row_keys = set(row.keys()) if isinstance(row, dict) else set()
+        column_lookup = self._column_lookup(row_keys)
         try:
-            response = self.llm_client.generate(messages=prompt)
+            response = self._generate(
+                ticket_id,
+                prompt,
+                stage="scraper_follow_up",
+                accept=lambda payload: bool(
+                    self._parse_fact_payload(payload, origin="scraper", valid_columns=column_lookup)
+                ),
+            )
         except Exception as exc:  # pragma: no cover - defensive fallback
             self._log_event(
                 ticket_id,
@@ -248,7 +536,6 @@ class QueryAgent:
             )
             return None
 
-        row_keys = set(row.keys()) if isinstance(row, dict) else set()
         follow_up = self._extract_follow_up_response(response, row_keys)
         facts = follow_up.get("facts") if follow_up else None
 
@@ -263,7 +550,7 @@ class QueryAgent:
         self._log_event(
             ticket_id,
             "scraper_follow_up_answered",
-            {
+            lambda: {
                 "concepts": [fact.get("concept") for fact in facts if isinstance(fact, dict)],
             },
         )
@@ -293,31 +580,185 @@ class QueryAgent:
         result["answer_origin"] = "scraper"
         return result
 
+    def answer_questions(self, questions: Sequence[dict[str, str]]) -> list[dict[str, Any]]:
+        """Answer a batch of questions, fetching their records with one query.
+
+        Each entry carries the `answer_question` keyword arguments. Records are
+        loaded up front by `prefetch`; results are returned in input order.
+        """
+
+        self.prefetch(questions)
+        return [self.answer_question(**entry) for entry in questions]
+
+    def prefetch(self, questions: Sequence[dict[str, str]]) -> None:
+        """Load the records for *questions* into the row cache via one `IN (...)` query.
+
+        Records that are already cached are skipped. Executors that do not
+        support `IN` lists raise `NotImplementedError`, in which case each
+        question simply fetches its own row later.
+        """
+
+        pending: dict[str, list[str]] = {}
+        for entry in questions:
+            record_id = entry["record_id"]
+            if record_id in pending or self._get_cached_row(record_id) is None:
+                pending.setdefault(record_id, []).append(entry["ticket_id"])
+        if len(pending) < _MIN_PREFETCH_BATCH:
+            return
+
+        record_ids = list(pending)
+        statement = self._build_batch_select_statement(len(record_ids))
+        for ticket_id in dict.fromkeys(
+            ticket for tickets in pending.values() for ticket in tickets
+        ):
+            self._log_event(
+                ticket_id,
+                "sql_executed",
+                {"record_ids": record_ids, "statement": statement},
+            )
+        try:
+            rows = self.sql_executor.run(statement, record_ids)
+        except NotImplementedError:
+            return
+        for row in rows:
+            key = row.get(self.primary_key_column)
+            # Popping keeps the first row per key, like the point lookup's LIMIT 1.
+            if key is not None and pending.pop(str(key), None) is not None:
+                self._cache_row(str(key), row)
+
+    async def a_answer_question(
+        self, *, ticket_id: str, question: str, record_id: str
+    ) -> dict[str, Any]:
+        """Async variant of `answer_question` that runs the blocking I/O off the loop."""
+
+        return await asyncio.to_thread(
+            self.answer_question, ticket_id=ticket_id, question=question, record_id=record_id
+        )
+
+    async def a_incorporate_scraper_findings(
+        self,
+        *,
+        ticket_id: str,
+        question: str,
+        record_id: str,
+        findings: Sequence[dict[str, Any]],
+        record_context: dict[str, Any] | None = None,
+    ) -> dict[str, Any] | None:
+        """Async variant of `incorporate_scraper_findings`."""
+
+        return await asyncio.to_thread(
+            self.incorporate_scraper_findings,
+            ticket_id=ticket_id,
+            question=question,
+            record_id=record_id,
+            findings=findings,
+            record_context=record_context,
+        )
+
+    async def answer_many(self, questions: Sequence[dict[str, str]]) -> list[dict[str, Any]]:
+        """Answer several questions concurrently, at most `max_concurrency` at a time.
+
+        Each entry carries the `answer_question` keyword arguments (`ticket_id`,
+        `question`, `record_id`). Results are returned in input order.
+
+        Questions run on worker threads, so `sql_executor`, `missing_data_flagger`,
+        `logger` and `llm_client` must tolerate concurrent calls.
+        """
+
+        await asyncio.to_thread(self.prefetch, questions)
+        semaphore = asyncio.Semaphore(max(self.max_concurrency, 1))
+
+        async def _bounded(kwargs: dict[str, str]) -> dict[str, Any]:
+            async with semaphore:
+                return await self.a_answer_question(**kwargs)
+
+        return list(await asyncio.gather(*(_bounded(dict(entry)) for entry in questions)))
+
+    def invalidate(self, record_id: str | None = None) -> None:
+        """Drop *record_id* from the row cache, or every cached row when omitted.
+
+        Cached answers for *record_id* are dropped as well.
+        """
+
+        with self._row_cache_lock:
+            if record_id is None:
+                self._row_cache.clear()
+            else:
+                self._row_cache.pop(record_id, None)
+        if record_id is not None and self.answer_cache is not None:
+            self.answer_cache.invalidate(record_id)
+
     def _fetch_record(self, ticket_id: str, record_id: str) -> dict[str, Any] | None:
-        statement = self._build_select_statement(record_id)
+        cached = self._get_cached_row(record_id)
+        if cached is not None:
+            self._log_event(ticket_id, "record_cache_hit", {"record_id": record_id})
+            return cached
+
+        statement = self._select_statement
         self._log_event(
             ticket_id,
             "sql_executed",
             {"record_id": record_id, "statement": statement},
         )
-        rows = self.sql_executor.run(statement)
+        rows = self.sql_executor.run(statement, (record_id,))
         found = rows[0] if rows else None
         self._log_event(
             ticket_id,
             "record_fetch_result",
             {"record_id": record_id, "found": bool(found)},
         )
+        if found is not None:
+            self._cache_row(record_id, found)
         return found
 
+    @staticmethod
+    def _row_version(row: dict[str, Any]) -> int | None:
+        """Fingerprint *row* so cached answers expire when its values change.
+
+        Returns ``None`` when the row can be neither hashed nor serialised, in
+        which case the answer is simply not cached.
+        """
+
+        try:
+            return hash(tuple(row.items()))
+        except TypeError:
+            pass
+        try:
+            return hash(json_utils.dumps(row))
+        except (TypeError, ValueError):
+            return None
+
     def _get_cached_row(self, record_id: str) -> dict[str, Any] | None:
-        if getattr(self, "_last_record_id", None) == record_id:
-            return getattr(self, "_last_row", None)
-        return None
+        with self._row_cache_lock:
+            entry = self._row_cache.get(record_id)
+            if entry is None:
+                return None
+            fetched_at, row = entry
+            if (
+                self.row_cache_ttl is not None
+                and time.monotonic() - fetched_at > self.row_cache_ttl
+            ):
+                del self._row_cache[record_id]
+                return None
+            self._row_cache.move_to_end(record_id)
+            return row
+
+    def _cache_row(self, record_id: str, row: dict[str, Any]) -> None:
+        if self.row_cache_size <= 0:
+            return
+        with self._row_cache_lock:
+            self._row_cache[record_id] = (time.monotonic(), row)
+            self._row_cache.move_to_end(record_id)
+            while len(self._row_cache) > self.row_cache_size:
+                self._row_cache.popitem(last=False)
 
-    def _build_select_statement(self, record_id: str) -> str:
-        safe_id = record_id.replace("'", "''")
+    def _build_select_statement(self) -> str:
+        return f"SELECT * FROM {self.table_name} WHERE {self.primary_key_column} = ? LIMIT 1"
+
+    def _build_batch_select_statement(self, count: int) -> str:
+        placeholders = ", ".join("?" * count)
         return (
-            f"SELECT * FROM {self.table_name} WHERE {self.primary_key_column} = '{safe_id}' LIMIT 1"
+            f"SELECT * FROM {self.table_name} WHERE {self.primary_key_column} IN ({placeholders})"
         )
 
     def _list_available_columns(self, row: dict[str, Any]) -> list[str]:
@@ -342,7 +783,7 @@ class QueryAgent:
         row: dict[str, Any],
         available_columns: list[str],
     ) -> list[str]:
-        lookup = self._build_column_lookup(set(available_columns))
+        lookup = self._column_lookup(available_columns)
         chosen: list[str] = []
 
         if self.llm_client is not None and available_columns:
@@ -366,24 +807,93 @@ class QueryAgent:
         if not normalized_question:
             return []
 
-        candidates: list[str] = []
-        for column in row:
-            synonyms = self._column_synonyms(column)
-            if any(phrase in normalized_question for phrase in synonyms):
-                candidates.append(column)
-                continue
+        index = self._synonym_index(row)
+        phrase_hits = index.matches(normalized_question)
+        question_tokens = frozenset(normalized_question.split())
+        # Populated columns claim the max_columns budget first; empty matches only
+        # fill what is left so they still surface as missing columns.
+        populated: list[str] = []
+        empty: list[str] = []
+        for position in sorted(phrase_hits | index.token_matches(question_tokens)):
+            column = index.columns[position]
+            if self._has_value(row[column]):
+                populated.append(column)
+                if len(populated) >= self.max_columns:
+                    break
+            else:
+                empty.append(column)
+        return (populated + empty)[: max(self.max_columns, 1)]
+
+    def _synonym_index(self, row: dict[str, Any]) -> _SynonymIndex:
+        schema_key = tuple(row)
+        index = _SYNONYM_INDEXES.get(schema_key)
+        if index is None:
+            normalized_columns = [self._normalize(column) for column in schema_key]
+            index = _SynonymIndex(
+                columns=schema_key,
+                column_tokens=tuple(map(self._column_tokens, normalized_columns)),
+            )
+            for position, column in enumerate(schema_key):
+                for phrase in self._column_synonyms(column, normalized_columns[position]):
+                    index.add(phrase, position)
+            if len(_SYNONYM_INDEXES) >= _SCHEMA_CACHE_LIMIT:
+                _SYNONYM_INDEXES.clear()
+            _SYNONYM_INDEXES[schema_key] = index
+        return index
+
+    def _speculate_facts(
+        self,
+        ticket_id: str,
+        question: str,
+        row: dict[str, Any],
+        available_columns: list[str],
+    ) -> tuple[list[str], Future[list[dict[str, Any]]]] | None:
+        """Start the fact LLM call for the heuristic columns while selection runs.
 
-            normalized_column = self._normalize(column)
-            if self._column_tokens_in_question(normalized_column, normalized_question):
-                candidates.append(column)
+        Only used when `llm_executor` is set and the heuristic columns are all empty,
+        i.e. when the fact call would follow column selection anyway. The result is
+        kept only if the LLM selects the same columns.
+        """
 
-        unique_candidates: list[str] = []
-        for column in candidates:
-            if column not in unique_candidates:
-                unique_candidates.append(column)
-            if len(unique_candidates) >= self.max_columns:
-                break
-        return unique_candidates
+        if self.llm_executor is None or self.llm_client is None or not available_columns:
+            return None
+        guessed = self._normalize_column_candidates(
+            self._infer_columns_from_question(question, row),
+            self._column_lookup(available_columns),
+        )
+        if self.max_columns:
+            guessed = guessed[: self.max_columns]
+        if not guessed or self._collect_direct_facts(row, guessed):
+            return None
+        # Facts are only logged once the speculation is known to be used.
+        future = self.llm_executor.submit(
+            self._resolve_facts_with_llm, ticket_id, question, row, guessed, log_facts=False
+        )
+        return guessed, future
+
+    def _discard_speculation(
+        self,
+        ticket_id: str,
+        speculation: tuple[list[str], Future[list[dict[str, Any]]]] | None,
+    ) -> None:
+        """Drop an unused speculative fact call, recording it if it already ran."""
+
+        if speculation is None:
+            return
+        guessed_columns, future = speculation
+        if future.cancel():
+            return
+
+        def _log_discarded(done: Future[list[dict[str, Any]]]) -> None:
+            facts = [] if done.exception() is not None else done.result()
+            self._log_event(
+                ticket_id,
+                "speculative_facts_discarded",
+                {"columns": guessed_columns, "fact_count": len(facts)},
+            )
+
+        # Runs now if the call has finished, otherwise on the worker when it does.
+        future.add_done_callback(_log_discarded)
 
     def _select_columns_with_llm(
         self,
@@ -393,6 +903,16 @@ class QueryAgent:
         available_columns: list[str],
         lookup: dict[str, str],
     ) -> list[str]:
+        cache_key = (self._normalize(question), tuple(available_columns))
+        cached = self.column_selection_cache.get(cache_key)
+        if cached is not None:
+            self._log_event(
+                ticket_id,
+                "columns_selected_cached",
+                {"question": question, "columns": cached},
+            )
+            return list(cached)
+
         prompt = self._build_column_selection_prompt(question, available_columns)
         try:
             response = self.llm_client.generate(messages=prompt)
@@ -406,6 +926,9 @@ class QueryAgent:
 
         selected = self._extract_column_selection(response, lookup)
         if selected:
+            if len(self.column_selection_cache) >= _COLUMN_SELECTION_CACHE_SIZE:
+                self.column_selection_cache.clear()
+            self.column_selection_cache[cache_key] = list(selected)
             self._log_event(
                 ticket_id,
                 "columns_selected_by_llm",
@@ -419,15 +942,26 @@ class QueryAgent:
         question: str,
         row: dict[str, Any],
         columns: list[str],
+        speculation: tuple[list[str], Future[list[dict[str, Any]]]] | None = None,
     ) -> list[dict[str, Any]]:
         direct_facts = self._collect_direct_facts(row, columns)
         if direct_facts:
+            self._discard_speculation(ticket_id, speculation)
             return direct_facts
 
         if self.llm_client is None:
             return []
 
-        llm_facts = self._resolve_facts_with_llm(ticket_id, question, row)
+        if speculation is not None:
+            guessed_columns, future = speculation
+            if guessed_columns == columns:
+                self._log_event(ticket_id, "speculative_facts_used", {"columns": guessed_columns})
+                facts = future.result()
+                self._log_llm_facts(ticket_id, facts)
+                return facts
+            self._discard_speculation(ticket_id, speculation)
+
+        llm_facts = self._resolve_facts_with_llm(ticket_id, question, row, columns)
         if llm_facts:
             return llm_facts
         return []
@@ -470,14 +1004,29 @@ class QueryAgent:
         return fact
 
     def _resolve_facts_with_llm(
-        self, ticket_id: str, question: str, row: dict[str, Any]
+        self,
+        ticket_id: str,
+        question: str,
+        row: dict[str, Any],
+        columns: list[str],
+        *,
+        log_facts: bool = True,
     ) -> list[dict[str, Any]]:
         if self.llm_client is None:
             return []
 
-        prompt = self._build_prompt(question, row)
+        # Only reached when none of *columns* has a stored value, so every selected
+        # column is one the model is being asked to fill.
+        prompt = self._build_prompt(question, row, columns, focus_columns=columns)
         try:
-            response = self.llm_client.generate(messages=prompt)
+            response = self._generate(
+                ticket_id,
+                prompt,
+                stage="direct_answer",
+                accept=lambda payload: bool(
+                    self._parse_fact_payload(payload, origin="llm", valid_columns=None)
+                ),
+            )
         except Exception as exc:  # pragma: no cover - defensive fallback
             self._log_event(
                 ticket_id,
@@ -487,13 +1036,69 @@ class QueryAgent:
             return []
 
         facts = self._extract_facts_from_response(response)
+        if log_facts:
+            self._log_llm_facts(ticket_id, facts)
+        return facts
+
+    def _log_llm_facts(self, ticket_id: str, facts: list[dict[str, Any]]) -> None:
         if facts:
             self._log_event(
                 ticket_id,
                 "llm_facts",
-                {"concepts": [fact.get("concept") for fact in facts]},
+                lambda: {"concepts": [fact.get("concept") for fact in facts]},
             )
-        return facts
+
+    def _generate(
+        self,
+        ticket_id: str,
+        prompt: list[dict[str, str]],
+        *,
+        stage: str,
+        accept: Callable[[dict[str, Any]], bool],
+    ) -> Any:
+        """Call the LLM, streaming when the client supports it.
+
+        While streaming, each JSON container is decoded once as soon as it is
+        complete; when *accept* approves a payload the stream is closed so the
+        remaining tokens are neither awaited nor generated. Clients may expose
+        ``can_stream()`` to opt out per call, and a stream that fails part-way
+        is retried as a plain ``generate`` request.
+        """
+
+        stream = getattr(self.llm_client, "stream", None)
+        can_stream = getattr(self.llm_client, "can_stream", None)
+        if stream is None or (can_stream is not None and not can_stream()):
+            return self.llm_client.generate(messages=prompt)
+
+        try:
+            return self._consume_stream(stream(messages=prompt), accept)
+        except Exception as exc:
+            self._log_event(
+                ticket_id,
+                "llm_stream_error",
+                {"stage": stage, "error": str(exc)},
+            )
+            return self.llm_client.generate(messages=prompt)
+
+    def _consume_stream(
+        self, chunks: Iterable[str], accept: Callable[[dict[str, Any]], bool]
+    ) -> _StreamedResponse:
+        scanner = _JsonValueScanner()
+        parts: list[str] = []
+        try:
+            for chunk in chunks:
+                parts.append(chunk)
+                if any(
+                    accept(payload)
+                    for candidate in scanner.feed(chunk)
+                    for payload in self._decode_json_strings(candidate)
+                ):
+                    break
+        finally:
+            close = getattr(chunks, "close", None)
+            if close is not None:
+                close()
+        return _StreamedResponse(output_text="".join(parts))
 
     def _build_column_selection_prompt(
         self, question: str, columns: Sequence[str]
@@ -520,9 +1125,7 @@ class QueryAgent:
             {"role": "user", "content": user_content},
         ]
 
-    def _extract_column_selection(
-        self, response: Any, lookup: dict[str, str]
-    ) -> list[str]:
+    def _extract_column_selection(self, response: Any, lookup: dict[str, str]) -> list[str]:
         for payload in self._iter_json_payloads(response):
             if not isinstance(payload, dict):
                 continue
@@ -544,8 +1147,17 @@ class QueryAgent:
 
         return []
 
-    def _build_prompt(self, question: str, row: dict[str, Any]) -> list[dict[str, str]]:
-        context = json.dumps(row, ensure_ascii=False)
+    def _build_prompt(
+        self,
+        question: str,
+        row: dict[str, Any],
+        columns: Sequence[str],
+        focus_columns: Sequence[str] | None = None,
+    ) -> list[dict[str, str]]:
+        context = self._serialize_row(row, columns)
+        focus_clause = (
+            f"\nColumns without a stored value: {', '.join(focus_columns)}" if focus_columns else ""
+        )
         return [
             {
                 "role": "system",
@@ -563,10 +1175,42 @@ class QueryAgent:
             },
             {
                 "role": "user",
-                "content": f"Record JSON: {context}\nQuestion: {question}",
+                "content": f"Record JSON: {context}{focus_clause}\nQuestion: {question}",
             },
         ]
 
+    def _serialize_row(self, row: dict[str, Any], columns: Sequence[str] | None = None) -> str:
+        """Return *row* (projected onto *columns* when given) as prompt JSON."""
+
+        key = tuple(columns) if columns is not None else None
+        cached = self._row_json_cache
+        if cached is not None and cached[0] is row and cached[1] == key:
+            return cached[2]
+        payload = row if columns is None else self._project_row(row, columns)
+        text = json_utils.dumps(payload)
+        self._row_json_cache = (row, key, text)
+        return text
+
+    def _project_row(self, row: dict[str, Any], columns: Sequence[str]) -> dict[str, Any]:
+        """Limit *row* to the selected columns plus business context for prompting."""
+
+        context_columns = (
+            self.context_columns if self.context_columns is not None else DEFAULT_CONTEXT_COLUMNS
+        )
+        focus = set(columns)
+        projected: dict[str, Any] = {}
+        for key in (*columns, *context_columns):
+            if key in projected or key not in row:
+                continue
+            value = row[key]
+            # Empty values carry no information, so only the selected columns keep them.
+            if key not in focus and not self._has_value(value):
+                continue
+            if isinstance(value, str):
+                value = self._truncate_text(value, PROMPT_VALUE_LIMIT)
+            projected[key] = value
+        return projected
+
     def _build_follow_up_prompt(
         self,
         *,
@@ -576,8 +1220,17 @@ class QueryAgent:
         findings: Sequence[dict[str, Any]],
     ) -> list[dict[str, str]]:
         columns = sorted(row.keys())
-        row_snapshot = json.dumps(row, ensure_ascii=False) if row else "{}"
-        context_snapshot = json.dumps(record_context or {}, ensure_ascii=False)
+        # The snapshot carries the question's columns, URL fields and business
+        # context; narrow rows add every stored value. Empty columns outside the
+        # question add tokens without information and are only listed by name.
+        focus = [
+            *self._infer_columns_from_question(question, row),
+            *(self.candidate_url_fields or ()),
+        ]
+        if len(row) <= self.prompt_column_limit:
+            focus.extend(column for column, value in row.items() if self._has_value(value))
+        row_snapshot = self._serialize_row(row, focus) if row else "{}"
+        context_snapshot = json_utils.dumps(record_context or {})
         evidence_text = self._format_findings(findings)
         columns_text = ", ".join(columns) if columns else "none"
         instructions = (
@@ -608,7 +1261,7 @@ class QueryAgent:
     def _extract_follow_up_response(
         self, response: Any, row_keys: set[str]
     ) -> dict[str, Any]:  # pragma: no cover - thin wrapper around parsing helper
-        column_lookup = self._build_column_lookup(row_keys)
+        column_lookup = self._column_lookup(row_keys)
 
         for payload in self._iter_json_payloads(response):
             if not isinstance(payload, dict):
@@ -630,7 +1283,11 @@ class QueryAgent:
                 raw_status = "answered" if facts else "insufficient"
 
             notes_value = payload.get("notes")
-            notes = notes_value.strip() if isinstance(notes_value, str) and notes_value.strip() else None
+            notes = (
+                notes_value.strip()
+                if isinstance(notes_value, str) and notes_value.strip()
+                else None
+            )
 
             aggregate_sources = self._normalize_sources(payload.get("sources"))
 
@@ -666,11 +1323,7 @@ class QueryAgent:
                 title = result.get("title") or result.get("name")
                 if isinstance(title, str) and title.strip():
                     parts.append(f"Title: {QueryAgent._truncate_text(title.strip())}")
-                snippet = (
-                    result.get("snippet")
-                    or result.get("text")
-                    or result.get("description")
-                )
+                snippet = result.get("snippet") or result.get("text") or result.get("description")
                 if isinstance(snippet, str) and snippet.strip():
                     parts.append(f"Snippet: {QueryAgent._truncate_text(snippet.strip())}")
             elif result is not None:
@@ -690,88 +1343,91 @@ class QueryAgent:
         return trimmed[: limit - 3] + "..."
 
     @staticmethod
-    def _iter_json_payloads(response: Any) -> list[dict[str, Any]]:
-        payloads: list[dict[str, Any]] = []
-        for text in QueryAgent._extract_response_text_blocks(response):
-            for candidate in QueryAgent._decode_json_strings(text):
-                payloads.append(candidate)
-        return payloads
+    def _iter_json_payloads(response: Any) -> Iterator[dict[str, Any]]:
+        # Lazily decode block by block: callers stop at the first usable payload,
+        # so later blocks are never scanned.
+        for text in QueryAgent._iter_response_texts(response):
+            yield from QueryAgent._decode_json_strings(text)
 
     @staticmethod
-    def _decode_json_strings(text: str) -> list[dict[str, Any]]:
+    def _decode_json_strings(text: str) -> Iterator[dict[str, Any]]:
         cleaned = text.strip()
         if not cleaned:
-            return []
+            return
 
         if cleaned.startswith("```"):
-            cleaned = re.sub(r"^```(?:json)?\n", "", cleaned)
-            cleaned = re.sub(r"```\s*$", "", cleaned)
+            if cleaned.startswith("```json\n"):
+                cleaned = cleaned[8:]
+            elif cleaned.startswith("```\n"):
+                cleaned = cleaned[4:]
+            if cleaned.endswith("```"):
+                cleaned = cleaned[:-3]
+
+        # Well-formed responses are a single JSON document; skip the scan for them.
+        try:
+            whole = json_utils.loads(cleaned)
+        except json.JSONDecodeError:
+            whole = None
+        if isinstance(whole, (dict, list)):
+            yield from _iter_json_dicts(whole)
+            return
 
-        decoder = json.JSONDecoder()
+        # Otherwise scan for embedded objects, yielding each one as soon as it is
+        # decoded so callers that stop early skip the rest of the text.
         index = 0
-        results: list[dict[str, Any]] = []
         length = len(cleaned)
 
         while index < length:
-            char = cleaned[index]
-            if char not in "[{":
-                index += 1
-                continue
+            start = _JSON_START_RE.search(cleaned, index)
+            if start is None:
+                break
+            index = start.start()
             try:
-                value, offset = decoder.raw_decode(cleaned, index)
+                value, offset = _JSON_DECODER.raw_decode(cleaned, index)
             except json.JSONDecodeError:
                 index += 1
                 continue
             index = offset
-            if isinstance(value, dict):
-                results.append(value)
-            elif isinstance(value, list):
-                for item in value:
-                    if isinstance(item, dict):
-                        results.append(item)
-
-        return results
+            yield from _iter_json_dicts(value)
 
     @staticmethod
-    def _extract_response_text_blocks(response: Any) -> list[str]:
+    def _iter_response_texts(response: Any) -> Iterator[str]:
+        # Each block is stripped once; duplicate copies (``output_text`` repeats
+        # the output blocks) are skipped by comparing the stripped text itself.
         seen: set[str] = set()
-        texts: list[str] = []
+        for text in QueryAgent._iter_raw_texts(response):
+            stripped = text.strip()
+            if not stripped or stripped in seen:
+                continue
+            seen.add(stripped)
+            yield stripped
+
+    @staticmethod
+    def _iter_raw_texts(response: Any) -> Iterator[str]:
         output = getattr(response, "output", [])
         for item in output:
             content = getattr(item, "content", None)
             if isinstance(content, list):
-                for block in content:
-                    text = getattr(block, "text", "")
-                    if isinstance(text, str) and QueryAgent._remember_text(text, seen):
-                        texts.append(text.strip())
+                texts = [getattr(block, "text", "") for block in content]
             elif isinstance(content, dict):
-                text = content.get("text") or content.get("output_text")
-                if isinstance(text, str) and QueryAgent._remember_text(text, seen):
-                    texts.append(text.strip())
+                texts = [content.get("text") or content.get("output_text")]
             elif content is not None:
-                text = getattr(content, "text", "")
-                if isinstance(text, str) and QueryAgent._remember_text(text, seen):
-                    texts.append(text.strip())
+                texts = [getattr(content, "text", "")]
+            else:
+                continue
+            yield from (text for text in texts if isinstance(text, str))
         for attr in ("output_text", "text"):
             raw = getattr(response, attr, None)
             if isinstance(raw, str):
-                if QueryAgent._remember_text(raw, seen):
-                    texts.append(raw.strip())
+                yield raw
             elif isinstance(raw, (list, tuple)):
                 for value in raw:
-                    if isinstance(value, str) and QueryAgent._remember_text(value, seen):
-                        texts.append(value.strip())
-        return texts
-
-    @staticmethod
-    def _remember_text(text: str, seen: set[str]) -> bool:
-        normalized = text.strip()
-        if not normalized or normalized in seen:
-            return False
-        seen.add(normalized)
-        return True
+                    if isinstance(value, str):
+                        yield value
 
-    def _extract_facts_from_response(self, response: Any, *, origin: str = "llm") -> list[dict[str, Any]]:
+    def _extract_facts_from_response(
+        self, response: Any, *, origin: str = "llm"
+    ) -> list[dict[str, Any]]:
         for payload in QueryAgent._iter_json_payloads(response):
             if not isinstance(payload, dict):
                 continue
@@ -854,10 +1510,7 @@ class QueryAgent:
     @staticmethod
     def _normalize_sources(sources: Any) -> list[str]:
         normalized: list[str] = []
-        if isinstance(sources, (list, tuple)):
-            iterable = sources
-        else:
-            iterable = [sources]
+        iterable = sources if isinstance(sources, (list, tuple)) else [sources]
 
         for item in iterable:
             if item is None:
@@ -872,16 +1525,14 @@ class QueryAgent:
     def _normalize_column_candidates(
         self, candidates: list[str], valid_columns: dict[str, str] | None
     ) -> list[str]:
-        unique: list[str] = []
-        seen: set[str] = set()
-        for candidate in candidates:
-            resolved = self._resolve_column_hint(candidate, valid_columns)
-            if not resolved:
-                continue
-            if resolved not in seen:
-                seen.add(resolved)
-                unique.append(resolved)
-        return unique
+        resolve = self._resolve_column_hint
+        return list(
+            dict.fromkeys(
+                resolved
+                for candidate in candidates
+                if (resolved := resolve(candidate, valid_columns))
+            )
+        )
 
     @staticmethod
     def _resolve_column_hint(candidate: str, valid_columns: dict[str, str] | None) -> str | None:
@@ -891,25 +1542,32 @@ class QueryAgent:
         if not valid_columns:
             return cleaned
 
+        # The lookup already maps both upper-cased and sanitised names, so the
+        # regex only runs when the plain upper-case lookup misses.
         upper = cleaned.upper()
-        if upper in valid_columns:
-            return valid_columns[upper]
-
-        sanitized = re.sub(r"[^A-Z0-9]+", "_", upper).strip("_")
-        if sanitized in valid_columns:
-            return valid_columns[sanitized]
-
-        return cleaned
+        column = valid_columns.get(upper)
+        if column is None:
+            column = valid_columns.get(_NON_UPPER_ALNUM_RE.sub("_", upper).strip("_"))
+        return cleaned if column is None else column
 
     @staticmethod
     def _canonicalise_concept(concept: str) -> str:
-        lowered = concept.strip().lower()
-        if not lowered:
-            return ""
-        return re.sub(r"[^a-z0-9]+", "_", lowered).strip("_")
+        return _canonical_concept(concept)
+
+    def _column_lookup(self, columns: Iterable[str]) -> dict[str, str]:
+        """Return the shared, read-only sanitised-name lookup for *columns*."""
+
+        key = frozenset(columns)
+        lookup = _COLUMN_LOOKUPS.get(key)
+        if lookup is None:
+            lookup = self._build_column_lookup(key)
+            if len(_COLUMN_LOOKUPS) >= _SCHEMA_CACHE_LIMIT:
+                _COLUMN_LOOKUPS.clear()
+            _COLUMN_LOOKUPS[key] = lookup
+        return lookup
 
     @staticmethod
-    def _build_column_lookup(columns: set[str]) -> dict[str, str]:
+    def _build_column_lookup(columns: Iterable[str]) -> dict[str, str]:
         lookup: dict[str, str] = {}
         for column in columns:
             label = column.strip()
@@ -917,8 +1575,8 @@ class QueryAgent:
                 continue
             upper = label.upper()
             lookup[upper] = column
-            sanitized = re.sub(r"[^A-Z0-9]+", "_", upper).strip("_")
-            if sanitized:
+            sanitized = _NON_UPPER_ALNUM_RE.sub("_", upper).strip("_")
+            if sanitized and sanitized != upper:
                 lookup[sanitized] = column
         return lookup
 
@@ -946,18 +1604,22 @@ class QueryAgent:
     def _has_value(value: Any) -> bool:
         if value is None:
             return False
+        # Exact-type checks cover CSV strings and JSON containers without an MRO walk.
+        kind = type(value)
+        if kind is str:
+            return value.strip() != ""
+        if kind in _CONTAINER_TYPES:
+            return len(value) > 0
         if isinstance(value, str):
             return value.strip() != ""
-        if isinstance(value, (list, tuple, set, dict)):
+        if isinstance(value, _CONTAINER_TYPES):
             return len(value) > 0
         return True
 
     @staticmethod
     def _determine_answer_origin(facts: Sequence[dict[str, Any]]) -> str | None:
         origins = {
-            fact.get("origin")
-            for fact in facts
-            if isinstance(fact, dict) and fact.get("origin")
+            fact.get("origin") for fact in facts if isinstance(fact, dict) and fact.get("origin")
         }
         if not origins:
             return None
@@ -969,36 +1631,28 @@ class QueryAgent:
             return "llm"
         return "mixed"
 
-    def _column_synonyms(self, column: str) -> set[str]:
-        base = DEFAULT_SYNONYMS.get(column.upper(), set())
-        derived = {
-            self._normalize(column),
+    def _column_synonyms(self, column: str, normalized: str | None = None) -> frozenset[str]:
+        base = DEFAULT_SYNONYMS.get(column.upper(), frozenset())
+        derived = (
+            self._normalize(column) if normalized is None else normalized,
             column.replace("_", " ").lower(),
-        }
-        return {phrase for phrase in base.union(derived) if phrase}
+        )
+        # Default synonyms are non-empty literals; only the derived forms need filtering.
+        return base | frozenset(filter(None, derived))
 
     @staticmethod
     def _column_to_concept(column: str) -> str:
-        normalized = QueryAgent._normalize(column)
-        if not normalized:
-            return column.strip().lower()
-        return normalized.replace(" ", "_")
+        return _concept_for_column(column)
 
     @staticmethod
-    def _column_tokens_in_question(column: str, question: str) -> bool:
-        if not column:
-            return False
-        column_tokens = {token for token in column.split() if len(token) >= TOKEN_MIN_LENGTH}
-        if not column_tokens:
-            return False
-        question_tokens = set(question.split())
-        return column_tokens.issubset(question_tokens)
+    def _column_tokens(normalized_column: str) -> frozenset[str]:
+        return frozenset(
+            token for token in normalized_column.split() if len(token) >= TOKEN_MIN_LENGTH
+        )
 
     @staticmethod
     def _normalize(text: str) -> str:
-        lowered = text.lower()
-        cleaned = re.sub(r"[^a-z0-9\s]", " ", lowered)
-        return re.sub(r"\s+", " ", cleaned).strip()
+        return _normalize_text(text)
 
     def _flag_missing(self, ticket_id: str, question: str, facts: dict[str, Any]) -> None:
         self._log_event(
@@ -1008,10 +1662,19 @@ class QueryAgent:
         )
         self.missing_data_flagger.flag_missing(ticket_id=ticket_id, question=question, facts=facts)
 
-    def _log_event(self, ticket_id: str, event: str, payload: dict[str, Any]) -> None:
+    def _log_event(
+        self,
+        ticket_id: str,
+        event: str,
+        payload: dict[str, Any] | Callable[[], dict[str, Any]],
+    ) -> None:
+        """Forward *payload* to the logger; callables are only invoked when one is set."""
+
         if self.logger is None:
             return
         try:
+            if callable(payload):
+                payload = payload()
             self.logger.log_event(ticket_id, event, payload)
         except Exception:
             # Observability failures must not impact question handling.
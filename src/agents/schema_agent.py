@@ -2,11 +2,26 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import sys
+from dataclasses import dataclass, field
 from typing import Any, Protocol
 
+from src.core import json_utils
 from src.integrations.openai_agent_sdk import OpenAIAgentAdapter
 
+# Spaces and hyphens become underscores in proposed column names.
+_NAME_TRANS = str.maketrans(" -", "__")
+# Checked in order for subclasses, so bool must stay ahead of int.
+_SQL_TYPE_MAP: dict[type, str] = {
+    bool: "BOOLEAN",
+    int: "INTEGER",
+    float: "NUMERIC",
+    dict: "JSONB",
+    list: "JSONB",
+}
+_PROPOSAL_CACHE_SIZE = 128
+_ALTER_TMPL = 'ALTER TABLE {table} ADD COLUMN IF NOT EXISTS "{name}" {data_type};'
+
 
 class MigrationWriter(Protocol):
     """Outputs SQL migration scripts for schema changes."""
@@ -33,13 +48,22 @@ class ColumnProposal:
         }
 
 
-@dataclass
+ProposalCache = dict[str, list[ColumnProposal]]
+
+
+@dataclass(slots=True)
 class SchemaAgent:
     """Evaluates schema gaps and proposes durable structural updates."""
 
     migration_writer: MigrationWriter
     table_name: str = "dataset"
     llm_client: OpenAIAgentAdapter | None = None
+    # Up to this many fields whose samples are all numbers or booleans are typed
+    # by the rule-based inference without an LLM call; 0 always consults the LLM.
+    llm_threshold: int = 0
+    # LLM proposals keyed by the prompt text, so re-escalated gaps skip the call.
+    # Pass a shared mapping so proposals outlive agents that are built per ticket.
+    proposal_cache: ProposalCache = field(repr=False, default_factory=dict)
 
     def propose_change(self, *, ticket_id: str, evidence_summary: dict[str, Any]) -> dict[str, Any]:
         """Return column specifications and migration metadata for review."""
@@ -66,7 +90,9 @@ class SchemaAgent:
                 "notes": "No unknown fields supplied",
             }
 
-        proposals = self._generate_proposals(unknown_fields)
+        proposals = (
+            [] if self._is_trivial(unknown_fields) else self._generate_proposals(unknown_fields)
+        )
         if not proposals:
             for raw_name, sample in unknown_fields.items():
                 column_name = self._normalize_name(raw_name)
@@ -82,7 +108,9 @@ class SchemaAgent:
                 )
 
         statements = [
-            f'ALTER TABLE {self.table_name} ADD COLUMN IF NOT EXISTS "{proposal.name}" {proposal.data_type};'
+            _ALTER_TMPL.format(
+                table=self.table_name, name=proposal.name, data_type=proposal.data_type
+            )
             for proposal in proposals
         ]
 
@@ -99,9 +127,18 @@ class SchemaAgent:
             "migration_statements": statements,
         }
 
+    def _is_trivial(self, unknown_fields: dict[str, Any]) -> bool:
+        """Return whether rule-based typing is as good as an LLM for *unknown_fields*."""
+
+        # Strings are excluded: they may hold dates, URLs or enums the LLM can type.
+        return len(unknown_fields) <= self.llm_threshold and all(
+            type(sample) in (bool, int, float) for sample in unknown_fields.values()
+        )
+
     @staticmethod
     def _normalize_name(raw_name: str) -> str:
-        return raw_name.strip().lower().replace(" ", "_").replace("-", "_").upper()
+        # Interned so proposal names match dataset column names by identity.
+        return sys.intern(raw_name.strip().translate(_NAME_TRANS).upper())
 
     @staticmethod
     def _describe_source(sample: Any) -> str:
@@ -113,30 +150,32 @@ class SchemaAgent:
 
     @staticmethod
     def _infer_sql_type(sample: Any) -> str:
-        if isinstance(sample, bool):
-            return "BOOLEAN"
-        if isinstance(sample, int):
-            return "INTEGER"
-        if isinstance(sample, float):
-            return "NUMERIC"
-        if isinstance(sample, (dict, list)):
-            return "JSONB"
+        sql_type = _SQL_TYPE_MAP.get(type(sample))
+        if sql_type is not None:
+            return sql_type
+        for kind, candidate in _SQL_TYPE_MAP.items():
+            if isinstance(sample, kind):
+                return candidate
         return "TEXT"
 
     def _generate_proposals(self, unknown_fields: dict[str, Any]) -> list[ColumnProposal]:
         if self.llm_client is None:
             return []
+        prompt_text = str(unknown_fields)
+        cached = self.proposal_cache.get(prompt_text)
+        if cached is not None:
+            return list(cached)
         messages = [
             {
                 "role": "system",
                 "content": (
                     "You design database columns. Given unknown field names and example"
-                    " values, respond with JSON: [{\"name\":...,\"data_type\":...,\"nullable\":bool,\"description\":...}]."
+                    ' values, respond with JSON: [{"name":...,"data_type":...,"nullable":bool,"description":...}].'
                 ),
             },
             {
                 "role": "user",
-                "content": str(unknown_fields),
+                "content": prompt_text,
             },
         ]
         try:
@@ -159,10 +198,16 @@ class SchemaAgent:
                         description=description,
                     )
                 )
+        if proposals:
+            if len(self.proposal_cache) >= _PROPOSAL_CACHE_SIZE:
+                self.proposal_cache.clear()
+            self.proposal_cache[prompt_text] = list(proposals)
         return proposals
 
 
-def _extract_schema_json(response: Any) -> list[dict[str, Any]]:  # pragma: no cover - helper akin to other parsers
+def _extract_schema_json(
+    response: Any,
+) -> list[dict[str, Any]]:  # pragma: no cover - helper akin to other parsers
     output = getattr(response, "output", [])
     for item in output:
         content = getattr(item, "content", None)
@@ -183,9 +228,7 @@ def _extract_schema_json(response: Any) -> list[dict[str, Any]]:  # pragma: no c
 
 
 def _safe_load_json(text: str) -> Any:  # pragma: no cover - helper
-    import json
-
     try:
-        return json.loads(text)
-    except json.JSONDecodeError:
+        return json_utils.loads(text)
+    except ValueError:
         return None
@@ -2,14 +2,38 @@
 
 from __future__ import annotations
 
-from collections.abc import Iterable, Sequence
+import contextlib
+import re
+from collections.abc import Iterable, Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Any, Protocol
 from urllib.parse import urlparse
 
 from src.core.observability import ScraperObservationSink
 from src.integrations.openai_agent_sdk import OpenAIAgentAdapter
 
+_PLAN_CACHE_SIZE = 256
+
+# LLM-drafted directives keyed by question, missing columns and company context,
+# stored as plain tuples because plan_research mutates the tasks it returns.
+PlanCache = dict[tuple[str, tuple[str, ...], str], tuple[tuple[str, str, str], ...]]
+
+
+@lru_cache(maxsize=8)
+def _ignored_host_pattern(keywords: frozenset[str]) -> re.Pattern[str]:
+    """Compile *keywords* into one alternation so each host is scanned once."""
+
+    return re.compile("|".join(map(re.escape, sorted(keywords))))
+
+
+@lru_cache(maxsize=4096)
+def _readable(column: str) -> str:
+    """Return *column* as lower-case words for search queries."""
+
+    return column.replace("_", " ").strip().lower()
+
 
 class SearchClient(Protocol):
     """Interface for running web searches or API lookups."""
@@ -20,6 +44,15 @@ class SearchClient(Protocol):
         """Return structured search results for a query."""
 
 
+class BatchSearchClient(SearchClient, Protocol):
+    """Search clients whose backend can answer several queries in one request."""
+
+    def search_many(
+        self, queries: Sequence[str], *, limit: int | None = None
+    ) -> list[list[dict[str, Any]]]:  # pragma: no cover - interface
+        """Return one result list per query, in query order."""
+
+
 class EvidenceSink(Protocol):
     """Destinations that persist gathered evidence alongside provenance."""
 
@@ -56,7 +89,7 @@ class ScrapeOutcome:
     backfill_prompt: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ScraperAgent:
     """Drafts research plans, manages subagents, and collates findings."""
 
@@ -65,6 +98,9 @@ class ScraperAgent:
     default_limit: int = 5
     logger: ScraperObservationSink | None = None
     llm_client: OpenAIAgentAdapter | None = None
+    max_parallel_searches: int = 8
+    # Pass a shared mapping so plans outlive agents that are built per ticket.
+    plan_cache: PlanCache = field(repr=False, default_factory=dict)
 
     def plan_research(
         self,
@@ -108,7 +144,7 @@ class ScraperAgent:
 
         if missing_columns:
             for column in missing_columns:
-                readable = column.replace("_", " ").strip().lower()
+                readable = _readable(column)
                 query_terms: list[str] = []
                 if company_name:
                     query_terms.append(f'"{company_name}"')
@@ -138,16 +174,18 @@ class ScraperAgent:
         if company_name:
             self._inject_company_name(tasks, company_name)
 
+        unique_tasks = self._dedupe_tasks(tasks)
         self._log_event(
             ticket_id=ticket_id,
             event="scrape_plan_created",
             payload={
                 "question": question,
-                "task_count": len(tasks),
+                "task_count": len(unique_tasks),
+                "duplicates_dropped": len(tasks) - len(unique_tasks),
                 "missing_columns": missing_columns,
             },
         )
-        return tasks
+        return unique_tasks
 
     def execute_plan(
         self, ticket_id: str, question: str, missing_facts: dict[str, Any]
@@ -164,17 +202,23 @@ class ScraperAgent:
                 event="scrape_task_started",
                 payload={"topic": task.topic, "query": task.query},
             )
-            results = self.search_client.search(task.query, limit=self.default_limit)
-            for rank, result in enumerate(results):
-                findings.append(
-                    {
-                        "ticket_id": ticket_id,
-                        "topic": task.topic,
-                        "query": task.query,
-                        "rank": rank,
-                        "result": result,
-                    }
-                )
+        # Searches are network-bound, so they run together; findings are still
+        # collected in task order and persisted per task, so evidence gathered
+        # before a failure is already on disk.
+        for task, results in zip(tasks, self._run_searches(tasks), strict=True):
+            task_findings = [
+                {
+                    "ticket_id": ticket_id,
+                    "topic": task.topic,
+                    "query": task.query,
+                    "rank": rank,
+                    "result": result,
+                }
+                for rank, result in enumerate(results)
+            ]
+            if task_findings:
+                self.evidence_sink.bulk_append(ticket_id, task_findings)
+                findings.extend(task_findings)
             if results:
                 successful.append(
                     {
@@ -195,7 +239,11 @@ class ScraperAgent:
             )
 
         if findings:
-            self.aggregate(ticket_id, findings)
+            self._log_event(
+                ticket_id=ticket_id,
+                event="scrape_findings_persisted",
+                payload={"count": len(findings)},
+            )
         else:
             self._log_event(
                 ticket_id=ticket_id,
@@ -221,6 +269,34 @@ class ScraperAgent:
             backfill_prompt=backfill_prompt,
         )
 
+    def _run_searches(self, tasks: Sequence[SearchTask]) -> Iterator[list[dict[str, Any]]]:
+        """Yield the results for each task in order, issuing up to `max_parallel_searches` at once.
+
+        Clients implementing `BatchSearchClient.search_many` get every query in a
+        single call instead.
+        """
+
+        search_many = getattr(self.search_client, "search_many", None)
+        if search_many is not None and tasks:
+            batched = list(search_many([task.query for task in tasks], limit=self.default_limit))
+            if len(batched) != len(tasks):
+                raise ValueError(
+                    f"search_many returned {len(batched)} result lists for {len(tasks)} queries"
+                )
+            for results in batched:
+                yield list(results or [])
+            return
+
+        def _search(task: SearchTask) -> list[dict[str, Any]]:
+            return self.search_client.search(task.query, limit=self.default_limit)
+
+        workers = min(self.max_parallel_searches, len(tasks))
+        if workers <= 1:
+            yield from map(_search, tasks)
+            return
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            yield from pool.map(_search, tasks)
+
     def aggregate(self, ticket_id: str, findings: Sequence[dict[str, Any]]) -> None:
         """Persist normalized evidence produced by scraper subagents."""
 
@@ -234,11 +310,9 @@ class ScraperAgent:
     def _log_event(self, ticket_id: str | None, event: str, payload: dict[str, Any]) -> None:
         if not ticket_id or self.logger is None:
             return
-        try:
+        # Observability must never block scraping.
+        with contextlib.suppress(Exception):
             self.logger.log_event(ticket_id, event, payload)
-        except Exception:
-            # Observability must never block scraping.
-            pass
 
     def _plan_with_llm(
         self,
@@ -252,6 +326,14 @@ class ScraperAgent:
             return []
         column_text = ", ".join(missing_columns) if missing_columns else "none"
         context_lines = self._format_record_context(record_context)
+        cache_key = (question, tuple(sorted(missing_columns)), context_lines)
+        cached = self.plan_cache.get(cache_key)
+        if cached is not None:
+            self._log_event(ticket_id, "llm_plan_cache_hit", {"task_count": len(cached)})
+            return [
+                SearchTask(topic=topic, query=query, description=description)
+                for topic, query, description in cached
+            ]
         messages = [
             {
                 "role": "system",
@@ -282,6 +364,11 @@ class ScraperAgent:
 
         tasks = self._parse_llm_plan(response)
         if tasks:
+            if len(self.plan_cache) >= _PLAN_CACHE_SIZE:
+                self.plan_cache.clear()
+            self.plan_cache[cache_key] = tuple(
+                (task.topic, task.query, task.description) for task in tasks
+            )
             self._log_event(
                 ticket_id,
                 "llm_plan_created",
@@ -296,9 +383,10 @@ class ScraperAgent:
             return []
         tasks: list[SearchTask] = []
         seen_hosts: set[str] = set()
+        ignored = _ignored_host_pattern(self.IGNORED_HOST_KEYWORDS)
         for url in candidate_urls:
             host = self._extract_host(url)
-            if not host or any(keyword in host for keyword in self.IGNORED_HOST_KEYWORDS):
+            if not host or ignored.search(host):
                 continue
             if host in seen_hosts:
                 continue
@@ -312,20 +400,32 @@ class ScraperAgent:
             )
         return tasks
 
+    @staticmethod
+    def _dedupe_tasks(tasks: list[SearchTask]) -> list[SearchTask]:
+        """Drop tasks repeating an earlier topic and query, ignoring case and spacing."""
+
+        unique: dict[tuple[str, str], SearchTask] = {}
+        for task in tasks:
+            key = (task.topic.lower(), " ".join(task.query.lower().split()))
+            unique.setdefault(key, task)
+        return list(unique.values())
+
     @staticmethod
     def _extract_host(url: str) -> str | None:
         parsed = urlparse(url.strip())
         host = parsed.netloc or parsed.path.split("/")[0]
         return host.lower() if host else None
 
-    IGNORED_HOST_KEYWORDS = {
-        "foodmetrics",
-        "internal",
-        "example.com",
-        "google.com",
-        "g.page",
-        "goo.gl",
-    }
+    IGNORED_HOST_KEYWORDS = frozenset(
+        {
+            "foodmetrics",
+            "internal",
+            "example.com",
+            "google.com",
+            "g.page",
+            "goo.gl",
+        }
+    )
 
     @staticmethod
     def _extract_company_name(record_context: dict[str, Any] | None) -> str | None:
@@ -381,7 +481,9 @@ class ScraperAgent:
             task.topic = ScraperAgent._replace_placeholders(task.topic, replacements)
 
     @staticmethod
-    def _parse_llm_plan(response: Any) -> list[SearchTask]:  # pragma: no cover - exercised via tests
+    def _parse_llm_plan(
+        response: Any,
+    ) -> list[SearchTask]:  # pragma: no cover - exercised via tests
         lines: list[str] = []
         output = getattr(response, "output", [])
         for item in output:
@@ -398,15 +500,13 @@ class ScraperAgent:
 
         tasks: list[SearchTask] = []
         for raw in lines:
-            parts = [part.strip() for part in raw.split("|")]
-            if len(parts) < 2:
+            if "|" not in raw:
                 continue
-            topic = parts[0] or "general"
-            query = parts[1] or ""
-            description = parts[2] if len(parts) > 2 else ""
+            # Pad so a missing description reads as empty; extra fields are ignored.
+            topic, query, description = ([part.strip() for part in raw.split("|")] + [""])[:3]
             if not query:
                 continue
-            tasks.append(SearchTask(topic=topic, query=query, description=description))
+            tasks.append(SearchTask(topic=topic or "general", query=query, description=description))
         return tasks
 
     @staticmethod
@@ -434,12 +534,14 @@ class ScraperAgent:
             if isinstance(column, str) and column.strip()
         ]
         if normalized_columns:
-            focus_text = ", ".join(sorted({col for col in normalized_columns}))
+            focus_text = ", ".join(sorted(set(normalized_columns)))
             target_clause = f"to capture {focus_text}"
         else:
             target_clause = "to capture the missing information"
 
-        question_text = question.strip() if question and question.strip() else "the stakeholder's request"
+        question_text = (
+            question.strip() if question and question.strip() else "the stakeholder's request"
+        )
 
         lines = [
             "You are backfilling newly accepted schema fields across the dataset.",
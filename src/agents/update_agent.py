@@ -3,11 +3,14 @@
 from __future__ import annotations
 
 import re
+from collections.abc import Sequence
 from dataclasses import dataclass, field
-from typing import Any, Protocol, Sequence
+from typing import Any, Protocol
 
 from src.integrations.openai_agent_sdk import OpenAIAgentAdapter
 
+_NON_UPPER_ALNUM_RE = re.compile(r"[^A-Z0-9]+")
+
 
 class CRMClient(Protocol):
     """API surface for interacting with the source-of-truth system."""
@@ -156,15 +159,12 @@ class UpdateAgent:
 
     @staticmethod
     def _coerce_fact_sequence(
-        facts: Sequence[dict[str, Any]] | dict[str, Any] | None
+        facts: Sequence[dict[str, Any]] | dict[str, Any] | None,
     ) -> list[dict[str, Any]]:
         if facts is None:
             return []
         if isinstance(facts, dict):
-            return [
-                {"concept": key, "value": value}
-                for key, value in facts.items()
-            ]
+            return [{"concept": key, "value": value} for key, value in facts.items()]
 
         coerced: list[dict[str, Any]] = []
         for entry in facts:
@@ -188,9 +188,7 @@ class UpdateAgent:
                 candidates.append(text)
         return candidates
 
-    def _match_fact_to_column(
-        self, concept: str, candidate_columns: Sequence[str]
-    ) -> str | None:
+    def _match_fact_to_column(self, concept: str, candidate_columns: Sequence[str]) -> str | None:
         if self.allowed_fields is None:
             # Fallback: trust provided hints or derive from concept.
             for candidate in candidate_columns:
@@ -233,7 +231,7 @@ class UpdateAgent:
             return ""
         if not isinstance(label, str):
             label = str(label)
-        return re.sub(r"[^A-Z0-9]+", "_", label.upper()).strip("_")
+        return _NON_UPPER_ALNUM_RE.sub("_", label.upper()).strip("_")
 
     @staticmethod
     def _tokens_from_label(label: str | None) -> set[str]:
@@ -250,7 +248,7 @@ class UpdateAgent:
                 continue
             upper = column.upper()
             lookup[upper] = upper
-            sanitized = re.sub(r"[^A-Z0-9]+", "_", upper).strip("_")
+            sanitized = _NON_UPPER_ALNUM_RE.sub("_", upper).strip("_")
             if sanitized:
                 lookup[sanitized] = upper
         return lookup
@@ -262,11 +260,7 @@ class UpdateAgent:
             normalized = UpdateAgent._normalize_label(column)
             if not normalized:
                 continue
-            tokens[column.upper()] = {
-                token.lower()
-                for token in normalized.split("_")
-                if token
-            }
+            tokens[column.upper()] = {token.lower() for token in normalized.split("_") if token}
         return tokens
 
     def _generate_reasoning(
@@ -303,7 +297,9 @@ class UpdateAgent:
         return _extract_text_response(response)
 
 
-def _extract_text_response(response: Any) -> str | None:  # pragma: no cover - helper mirrors query agent logic
+def _extract_text_response(
+    response: Any,
+) -> str | None:  # pragma: no cover - helper mirrors query agent logic
     output = getattr(response, "output", [])
     for item in output:
         content = getattr(item, "content", None)
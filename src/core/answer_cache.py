@@ -0,0 +1,42 @@
+"""Answer cache implementations used by the query agent."""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any
+
+from src.agents.query_agent import AnswerCache, AnswerCacheKey
+
+
+@dataclass(slots=True)
+class InMemoryAnswerCache(AnswerCache):
+    """Process-local LRU of answered questions shared across agent instances."""
+
+    max_entries: int = 256
+    _entries: OrderedDict[AnswerCacheKey, dict[str, Any]] = field(
+        init=False, repr=False, default_factory=OrderedDict
+    )
+    _lock: threading.Lock = field(init=False, repr=False, default_factory=threading.Lock)
+
+    def get(self, key: AnswerCacheKey) -> dict[str, Any] | None:  # type: ignore[override]
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+            return value
+
+    def put(self, key: AnswerCacheKey, value: dict[str, Any]) -> None:  # type: ignore[override]
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, record_id: str) -> None:  # type: ignore[override]
+        with self._lock:
+            for key in [key for key in self._entries if key[0] == record_id]:
+                del self._entries[key]
@@ -2,33 +2,51 @@
 
 from __future__ import annotations
 
+import atexit
 import os
-from dataclasses import dataclass
+import threading
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
-from src.agents.query_agent import MissingDataFlagger, SQLExecutor
-from src.agents.schema_agent import SchemaAgent
-from src.agents.scraper_agent import ScraperAgent, SearchClient
+from src.agents.query_agent import (
+    AnswerCache,
+    ColumnSelectionCache,
+    MissingDataFlagger,
+    SQLExecutor,
+)
+from src.agents.schema_agent import ProposalCache, SchemaAgent
+from src.agents.scraper_agent import PlanCache, ScraperAgent, SearchClient
 from src.agents.update_agent import UpdateAgent
+from src.core.answer_cache import InMemoryAnswerCache
 from src.core.config import Settings
 from src.core.evidence import JSONLEvidenceSink
 from src.core.migrations import FileMigrationWriter
+from src.core.missing_data import JSONLMissingDataFlagger
 from src.core.observability import (
+    AsyncObservationSink,
     JSONLQueryLogger,
     JSONLScraperLogger,
     QueryObservationSink,
     ScraperObservationSink,
 )
-from src.core.missing_data import JSONLMissingDataFlagger
 from src.core.schema import JSONLSchemaEscalator
 from src.integrations.csv_crm_client import CsvCRMClient
 from src.integrations.csv_sql_executor import CsvSQLExecutor
 from src.integrations.in_memory_sql_executor import InMemorySQLExecutor
-from src.integrations.openai_models import GPTResponseClient, OpenAIClientFactory
 from src.integrations.openai_agent_sdk import OpenAIAgentAdapter
+from src.integrations.openai_models import GPTResponseClient, OpenAIClientFactory
 from src.integrations.openai_search import OpenAIWebSearchClient
 
+_BACKGROUND_SINKS: dict[tuple[type, Path], AsyncObservationSink] = {}
+_BACKGROUND_SINKS_LOCK = threading.Lock()
+# Dependencies are rebuilt per ticket, so the answer cache lives at process scope
+# for repeat questions to hit it.
+_ANSWER_CACHE = InMemoryAnswerCache()
+_PLAN_CACHE: PlanCache = {}
+_COLUMN_SELECTION_CACHE: ColumnSelectionCache = {}
+_PROPOSAL_CACHE: ProposalCache = {}
+
 
 @dataclass(slots=True)
 class RunnerDependencies:
@@ -44,6 +62,8 @@ class RunnerDependencies:
     gpt_client: OpenAIAgentAdapter | None = None
     candidate_url_fields: list[str] | None = None
     dataset_columns: list[str] | None = None
+    answer_cache: AnswerCache | None = None
+    column_selection_cache: ColumnSelectionCache = field(default_factory=dict)
 
 
 def build_dependencies(settings: Settings) -> RunnerDependencies:
@@ -62,12 +82,13 @@ def build_dependencies(settings: Settings) -> RunnerDependencies:
     evidence_sink = JSONLEvidenceSink(base_dir=scrapes_dir)
     search_client: SearchClient = _build_search_client(settings)
     scraper_logs_dir = _resolve_scraper_logs_dir(settings)
-    scraper_logger = JSONLScraperLogger(base_dir=scraper_logs_dir)
+    scraper_logger = _background_sink(JSONLScraperLogger, scraper_logs_dir)
     scraper_agent = ScraperAgent(
         search_client=search_client,
         evidence_sink=evidence_sink,
         logger=scraper_logger,
         llm_client=None,  # placeholder; updated after response client construction
+        plan_cache=_PLAN_CACHE,
     )
 
     schema_dir = _resolve_schema_dir(settings)
@@ -85,10 +106,12 @@ def build_dependencies(settings: Settings) -> RunnerDependencies:
         allowed_fields=column_catalog if column_catalog else None,
         llm_client=None,
     )
-    schema_agent = SchemaAgent(migration_writer=migration_writer, llm_client=None)
+    schema_agent = SchemaAgent(
+        migration_writer=migration_writer, llm_client=None, proposal_cache=_PROPOSAL_CACHE
+    )
 
     query_logs_dir = _resolve_query_logs_dir(settings)
-    query_logger = JSONLQueryLogger(base_dir=query_logs_dir)
+    query_logger = _background_sink(JSONLQueryLogger, query_logs_dir)
     response_client = _build_response_client(settings)
     agent_client = _build_agent_client(settings, response_client)
     candidate_url_fields = _detect_candidate_url_fields(executor)
@@ -110,9 +133,26 @@ def build_dependencies(settings: Settings) -> RunnerDependencies:
         gpt_client=agent_client,
         candidate_url_fields=candidate_url_fields,
         dataset_columns=dataset_columns,
+        answer_cache=_ANSWER_CACHE,
+        column_selection_cache=_COLUMN_SELECTION_CACHE,
     )
 
 
+def _background_sink(
+    logger_cls: type[JSONLQueryLogger] | type[JSONLScraperLogger], base_dir: Path
+) -> AsyncObservationSink:
+    # The web app builds dependencies per ticket, so each log directory shares one
+    # sink, worker thread and exit hook for the life of the process.
+    key = (logger_cls, base_dir.resolve())
+    with _BACKGROUND_SINKS_LOCK:
+        sink = _BACKGROUND_SINKS.get(key)
+        if sink is None:
+            sink = AsyncObservationSink(inner=logger_cls(base_dir=base_dir))
+            atexit.register(sink.flush)
+            _BACKGROUND_SINKS[key] = sink
+    return sink
+
+
 def _resolve_scrapes_dir(settings: Settings) -> Path:
     base = (
         settings.paths.scrapes_dir
@@ -34,13 +34,20 @@ class JSONLEvidenceSink(EvidenceSink):
     def append(
         self, ticket_id: str, payload: dict[str, Any]
     ) -> None:  # pragma: no cover - exercised via bulk
-        prepared = dict(payload)
-        prepared.setdefault("timestamp", utc_now_iso())
-        target = resolve_log_path(self.base_dir, ticket_id, prepared["timestamp"])
-        with target.open("a", encoding="utf-8") as handle:
-            json.dump(prepared, handle, ensure_ascii=False)
-            handle.write("\n")
+        self.bulk_append(ticket_id, (payload,))
 
     def bulk_append(self, ticket_id: str, payloads: Iterable[dict[str, Any]]) -> None:
-        for payload in payloads:
-            self.append(ticket_id, payload)
+        """Write *payloads* with a single open of the ticket's evidence file."""
+
+        prepared = [self._prepare(payload) for payload in payloads]
+        if not prepared:
+            return
+        target = resolve_log_path(self.base_dir, ticket_id, prepared[0]["timestamp"])
+        with target.open("a", encoding="utf-8") as handle:
+            handle.writelines(json.dumps(entry, ensure_ascii=False) + "\n" for entry in prepared)
+
+    @staticmethod
+    def _prepare(payload: dict[str, Any]) -> dict[str, Any]:
+        prepared = dict(payload)
+        prepared.setdefault("timestamp", utc_now_iso())
+        return prepared
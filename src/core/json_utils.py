@@ -0,0 +1,34 @@
+"""JSON helpers that use orjson when it is installed."""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ModuleNotFoundError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore[assignment]
+
+
+def dumps(value: Any) -> str:
+    """Serialize *value* compactly, keeping non-ASCII characters readable.
+
+    Both backends emit the same separators so prompts do not depend on which one
+    is installed.
+    """
+
+    if orjson is not None:
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+
+
+def loads(text: str) -> Any:
+    """Parse *text*, raising `json.JSONDecodeError` when it is not valid JSON."""
+
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+__all__ = ["dumps", "loads"]
@@ -7,8 +7,8 @@ from datetime import UTC, datetime
 from pathlib import Path
 from typing import Dict, Tuple
 
-
 _FILENAME_CACHE: Dict[Tuple[str, str], Path] = {}
+_UNSAFE_FILENAME_RE = re.compile(r"[^A-Za-z0-9_-]+")
 
 
 def make_timestamp_slug(raw: str | None = None) -> str:
@@ -33,7 +33,7 @@ def make_timestamp_slug(raw: str | None = None) -> str:
 def sanitize_ticket_id(ticket_id: str) -> str:
     """Sanitize *ticket_id* so it can be embedded in filenames."""
 
-    cleaned = re.sub(r"[^A-Za-z0-9_-]+", "-", ticket_id.strip())
+    cleaned = _UNSAFE_FILENAME_RE.sub("-", ticket_id.strip())
     return cleaned or "ticket"
 
 
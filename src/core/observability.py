@@ -3,7 +3,10 @@
 from __future__ import annotations
 
 import json
-from dataclasses import dataclass
+import queue
+import threading
+from collections.abc import Sequence
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Protocol
 
@@ -13,26 +16,39 @@ from src.core.logging_utils import resolve_log_path, utc_now_iso
 class QueryObservationSink(Protocol):
     """Records lifecycle events emitted by the query agent."""
 
-    def log_event(self, ticket_id: str, event: str, payload: dict[str, Any]) -> None:  # pragma: no cover - interface
+    def log_event(
+        self, ticket_id: str, event: str, payload: dict[str, Any]
+    ) -> None:  # pragma: no cover - interface
         ...
 
 
 class ScraperObservationSink(Protocol):
     """Records lifecycle events emitted by the scraper agent."""
 
-    def log_event(self, ticket_id: str, event: str, payload: dict[str, Any]) -> None:  # pragma: no cover - interface
+    def log_event(
+        self, ticket_id: str, event: str, payload: dict[str, Any]
+    ) -> None:  # pragma: no cover - interface
         ...
 
 
+_MAX_DRAIN_BATCH = 256
+
+
 def _write_jsonl(base_dir: Path, ticket_id: str, payload: dict[str, Any]) -> None:
+    _write_jsonl_many(base_dir, ticket_id, (payload,))
+
+
+def _write_jsonl_many(base_dir: Path, ticket_id: str, payloads: Sequence[dict[str, Any]]) -> None:
+    if not payloads:
+        return
+    first = payloads[0]
     target = resolve_log_path(
         base_dir=base_dir,
         ticket_id=ticket_id,
-        timestamp=payload.get("timestamp") if isinstance(payload, dict) else None,
+        timestamp=first.get("timestamp") if isinstance(first, dict) else None,
     )
     with target.open("a", encoding="utf-8") as handle:
-        json.dump(payload, handle, ensure_ascii=False)
-        handle.write("\n")
+        handle.writelines(json.dumps(payload, ensure_ascii=False) + "\n" for payload in payloads)
 
 
 def _build_event(event: str, payload: dict[str, Any]) -> dict[str, Any]:
@@ -51,6 +67,13 @@ class JSONLQueryLogger(QueryObservationSink):
     def log_event(self, ticket_id: str, event: str, payload: dict[str, Any]) -> None:  # type: ignore[override]
         _write_jsonl(self.base_dir, ticket_id, _build_event(event, payload))
 
+    def log_events(self, ticket_id: str, events: Sequence[tuple[str, dict[str, Any]]]) -> None:
+        """Append several events for *ticket_id* with a single file open."""
+
+        _write_jsonl_many(
+            self.base_dir, ticket_id, [_build_event(event, payload) for event, payload in events]
+        )
+
 
 @dataclass(slots=True)
 class JSONLScraperLogger(ScraperObservationSink):
@@ -60,3 +83,81 @@ class JSONLScraperLogger(ScraperObservationSink):
 
     def log_event(self, ticket_id: str, event: str, payload: dict[str, Any]) -> None:  # type: ignore[override]
         _write_jsonl(self.base_dir, ticket_id, _build_event(event, payload))
+
+    def log_events(self, ticket_id: str, events: Sequence[tuple[str, dict[str, Any]]]) -> None:
+        """Append several events for *ticket_id* with a single file open."""
+
+        _write_jsonl_many(
+            self.base_dir, ticket_id, [_build_event(event, payload) for event, payload in events]
+        )
+
+
+@dataclass(slots=True)
+class AsyncObservationSink:
+    """Forwards events to *inner* from a background thread.
+
+    Callers only pay for a non-blocking enqueue, so a slow sink no longer adds to
+    agent latency. Events that arrive while the queue is full are dropped and
+    counted in `dropped`. Timestamps are stamped at enqueue time so they reflect
+    when the event happened rather than when it was written. When the inner sink
+    offers `log_events`, events already waiting in the queue are handed over in
+    per-ticket batches.
+    """
+
+    inner: QueryObservationSink | ScraperObservationSink
+    max_queue_size: int = 10_000
+    dropped: int = field(init=False, default=0)
+    _queue: queue.Queue[tuple[str, str, dict[str, Any]]] = field(init=False, repr=False)
+    _worker: threading.Thread = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._queue = queue.Queue(maxsize=self.max_queue_size)
+        self._worker = threading.Thread(target=self._drain, name="observability-sink", daemon=True)
+        self._worker.start()
+
+    def log_event(self, ticket_id: str, event: str, payload: dict[str, Any]) -> None:
+        stamped = dict(payload)
+        stamped.setdefault("timestamp", utc_now_iso())
+        try:
+            self._queue.put_nowait((ticket_id, event, stamped))
+        except queue.Full:
+            self.dropped += 1
+
+    def flush(self) -> None:
+        """Block until every queued event has been handed to the inner sink."""
+
+        self._queue.join()
+
+    def _drain(self) -> None:
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < _MAX_DRAIN_BATCH:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                self._forward(batch)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    def _forward(self, batch: list[tuple[str, str, dict[str, Any]]]) -> None:
+        log_events = getattr(self.inner, "log_events", None)
+        start = 0
+        for index in range(1, len(batch) + 1):
+            # Consecutive events of one ticket share a write; order is preserved.
+            if index < len(batch) and batch[index][0] == batch[start][0]:
+                continue
+            ticket_id = batch[start][0]
+            try:
+                if log_events is not None:
+                    log_events(
+                        ticket_id, [(event, payload) for _, event, payload in batch[start:index]]
+                    )
+                else:
+                    for _, event, payload in batch[start:index]:
+                        self.inner.log_event(ticket_id, event, payload)
+            except Exception:  # pragma: no cover - sinks must never break the worker
+                pass
+            start = index
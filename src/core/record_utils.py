@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
-from typing import Any, Iterable
+import re
+from collections.abc import Iterable
+from typing import Any
 
 DEFAULT_CONTEXT_COLUMNS: tuple[str, ...] = (
     "BUSINESS_NAME",
@@ -16,6 +18,13 @@ DEFAULT_CONTEXT_COLUMNS: tuple[str, ...] = (
 
 _MISSING_TEXT = {"na", "n/a", "none", "null", "nan"}
 
+# Explicit scheme or ``www.`` prefix, otherwise a space-free host containing a dot
+# and at least one letter, not ending in a dot, optionally followed by a path.
+_URL_RE = re.compile(
+    r"(?P<scheme>https?://)|www\.|(?=[^/]*[^\W\d_])[^/ ]*\.[^/ ]*(?<!\.)(?:/[^ ]*)?\Z",
+    re.IGNORECASE,
+)
+
 
 def build_record_context(
     row: dict[str, Any] | None,
@@ -42,19 +51,29 @@ def extract_candidate_urls(
     row: dict[str, Any] | None,
     candidate_fields: Iterable[str] | None = None,
 ) -> list[str]:
-    """Return normalized URL candidates derived from *row*."""
+    """Return normalized URL candidates derived from *row*.
+
+    When scanning every column, non-string values (ids, dates, numbers) are
+    skipped without conversion; explicitly listed *candidate_fields* are still
+    coerced with `str()`.
+    """
 
     if not row:
         return []
 
     urls: list[str] = []
     seen: set[str] = set()
-    columns = list(candidate_fields) if candidate_fields is not None else list(row.keys())
+    coerce = candidate_fields is not None
+    columns = list(candidate_fields) if coerce else list(row.keys())
     for column in columns:
         value = row.get(column)
         if not value:
             continue
-        normalized = normalize_url(str(value))
+        if not isinstance(value, str):
+            if not coerce:
+                continue
+            value = str(value)
+        normalized = normalize_url(value)
         if not normalized or normalized in seen:
             continue
         urls.append(normalized)
@@ -62,46 +81,64 @@ def extract_candidate_urls(
     return urls
 
 
+def scan_record(
+    row: dict[str, Any] | None,
+    candidate_fields: Iterable[str] | None = None,
+    context_columns: Iterable[str] | None = None,
+) -> tuple[list[str], dict[str, Any]]:
+    """Return ``(candidate URLs, record context)`` for *row*.
+
+    Equivalent to calling `extract_candidate_urls` and `build_record_context`,
+    but when every column is scanned for URLs the context values are picked up
+    during the same pass over the row.
+    """
+
+    if not row:
+        return [], {}
+    if candidate_fields is not None:
+        return (
+            extract_candidate_urls(row, candidate_fields),
+            build_record_context(row, context_columns),
+        )
+
+    selected = tuple(context_columns) if context_columns is not None else DEFAULT_CONTEXT_COLUMNS
+    wanted = frozenset(selected)
+    found: dict[str, Any] = {}
+    urls: list[str] = []
+    seen: set[str] = set()
+    for column, value in row.items():
+        if (
+            column in wanted
+            and value is not None
+            and not (isinstance(value, str) and _is_missing_text(value))
+        ):
+            found[column] = value
+        if not value or not isinstance(value, str):
+            continue
+        normalized = normalize_url(value)
+        if not normalized or normalized in seen:
+            continue
+        urls.append(normalized)
+        seen.add(normalized)
+    context = {column: found[column] for column in selected if column in found}
+    return urls, context
+
+
 def normalize_url(value: str) -> str | None:
     """Normalize *value* into a navigable URL when possible."""
 
     text = value.strip()
-    if not looks_like_url(text):
+    match = _URL_RE.match(text)
+    if match is None:
         return None
-
-    lowered = text.lower()
-    if lowered.startswith("http://") or lowered.startswith("https://"):
-        base = text
-    elif lowered.startswith("www."):
-        base = f"https://{text}"
-    else:
-        base = f"https://{text}"
+    base = text if match.group("scheme") else f"https://{text}"
     return base.rstrip("/")
 
 
 def looks_like_url(value: str) -> bool:
     """Heuristic check for whether *value* resembles a URL or hostname."""
 
-    text = value.strip()
-    if not text:
-        return False
-
-    lowered = text.lower()
-    if lowered.startswith("http://") or lowered.startswith("https://"):
-        return True
-    if lowered.startswith("www."):
-        return True
-    if " " in lowered:
-        return False
-    if "." not in lowered:
-        return False
-
-    host_candidate = lowered.split("/")[0]
-    if host_candidate.count(".") >= 1 and not host_candidate.endswith(".") and any(
-        ch.isalpha() for ch in host_candidate
-    ):
-        return True
-    return False
+    return _URL_RE.match(value.strip()) is not None
 
 
 def _is_missing_text(value: str) -> bool:
@@ -117,4 +154,5 @@ __all__ = [
     "extract_candidate_urls",
     "looks_like_url",
     "normalize_url",
+    "scan_record",
 ]
@@ -78,8 +78,7 @@ class Runner:
         scenario_enrichment = scenario.get("enriched_fields")
         if isinstance(scenario_enrichment, dict):
             return [
-                {"concept": str(key), "value": value}
-                for key, value in scenario_enrichment.items()
+                {"concept": str(key), "value": value} for key, value in scenario_enrichment.items()
             ]
 
         if result.get("status") == "answered":
@@ -136,6 +135,8 @@ def run_scenario(dependencies: RunnerDependencies, scenario: dict[str, Any]) ->
         logger=dependencies.query_logger,
         candidate_url_fields=dependencies.candidate_url_fields,
         dataset_columns=dependencies.dataset_columns,
+        answer_cache=dependencies.answer_cache,
+        column_selection_cache=dependencies.column_selection_cache,
     )
 
     result = agent.answer_question(
@@ -158,14 +159,11 @@ def run_scenario(dependencies: RunnerDependencies, scenario: dict[str, Any]) ->
     schema_proposal: dict[str, Any] | None = None
 
     answer_origin = result.get("answer_origin")
-    same_as_answer = (
-        isinstance(enrichment_payload, list)
-        and enrichment_payload == result.get("facts")
+    same_as_answer = isinstance(enrichment_payload, list) and enrichment_payload == result.get(
+        "facts"
     )
     skip_update = (
-        result.get("status") == "answered"
-        and answer_origin == "dataset"
-        and same_as_answer
+        result.get("status") == "answered" and answer_origin == "dataset" and same_as_answer
     )
 
     if enrichment_payload and not skip_update:
@@ -7,9 +7,10 @@ import asyncio
 import json
 import logging
 import threading
+from collections.abc import AsyncIterator
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, AsyncIterator, Literal
+from typing import Any, Literal
 from uuid import uuid4
 
 from fastapi import BackgroundTasks, FastAPI, HTTPException, Query, status
@@ -17,14 +18,13 @@ from fastapi.responses import FileResponse, JSONResponse, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 from pydantic import BaseModel, Field
 
+from src.core.chat import describe_query_event, describe_scraper_event
 from src.core.config import Settings, load_settings
 from src.core.dependencies import RunnerDependencies, build_dependencies
-from src.core.record_utils import build_record_context, extract_candidate_urls
 from src.core.migrations import FileMigrationWriter
-from src.integrations.csv_sql_executor import CsvSQLExecutor
+from src.core.record_utils import scan_record
 from src.core.runner import run_scenario
-from src.core.chat import describe_query_event, describe_scraper_event
-
+from src.integrations.csv_sql_executor import CsvSQLExecutor
 
 LOGGER = logging.getLogger(__name__)
 
@@ -150,7 +150,9 @@ class RealtimeBroker:
             },
         )
 
-    def publish_result(self, ticket_id: str, result: dict[str, Any], timeline: list[TimelineEntry]) -> None:
+    def publish_result(
+        self, ticket_id: str, result: dict[str, Any], timeline: list[TimelineEntry]
+    ) -> None:
         self.publish(
             ticket_id,
             {
@@ -266,9 +268,8 @@ class DatasetService:
     ) -> dict[str, Any] | None:
         pk = primary_key or self.default_primary_key
         table = table_name or self.table_name
-        safe_id = record_id.replace("'", "''")
-        statement = f"SELECT * FROM {table} WHERE {pk} = '{safe_id}' LIMIT 1"
-        rows = self.executor.run(statement)
+        statement = f"SELECT * FROM {table} WHERE {pk} = ? LIMIT 1"
+        rows = self.executor.run(statement, (record_id,))
         return rows[0] if rows else None
 
 
@@ -403,9 +404,7 @@ class TimelineUpdateAgent:
             self.timeline.add("update", "Passing new facts to the update agent.")
         else:
             self.timeline.add("update", "Update agent check with no new facts provided.")
-        result = self.inner.apply_enrichment(
-            ticket_id=ticket_id, record_id=record_id, facts=facts
-        )
+        result = self.inner.apply_enrichment(ticket_id=ticket_id, record_id=record_id, facts=facts)
         status = result.get("status")
         if status:
             self.timeline.add("update", f"Update agent finished with status '{status}'.")
@@ -518,8 +517,7 @@ def create_app(
         )
         if record is None:
             raise HTTPException(status_code=404, detail="Record not found")
-        context = build_record_context(record)
-        urls = extract_candidate_urls(record)
+        urls, context = scan_record(record)
         return DatasetRecordResponse(
             record=record,
             record_context=context,
@@ -547,7 +545,9 @@ def create_app(
                 statements.append(clause)
 
         if not statements:
-            LOGGER.warning("Schema apply rejected: no statements for ticket_id=%s", payload.ticket_id)
+            LOGGER.warning(
+                "Schema apply rejected: no statements for ticket_id=%s", payload.ticket_id
+            )
             raise HTTPException(status_code=400, detail="No schema changes supplied")
 
         migration_name = payload.migration_name or f"ticket_{payload.ticket_id.lower()}_ui"
@@ -569,9 +569,7 @@ def create_app(
                 try:
                     executor.add_column(column.name)
                 except Exception as exc:  # pragma: no cover - defensive
-                    LOGGER.warning(
-                        "Failed to add column '%s' to CSV: %s", column.name, exc
-                    )
+                    LOGGER.warning("Failed to add column '%s' to CSV: %s", column.name, exc)
             dataset_service.refresh_columns()
 
             if payload.record_id and payload.row_assignments:
@@ -651,8 +649,7 @@ def create_app(
             payload.record_id,
             table_name,
         )
-        context = build_record_context(record)
-        candidate_urls = extract_candidate_urls(record)
+        candidate_urls, context = scan_record(record)
         return SessionStartResponse(
             session_id=session_id,
             record_id=payload.record_id,
@@ -681,8 +678,7 @@ def create_app(
                 session_id,
             )
             raise HTTPException(status_code=404, detail="Record not found")
-        context = build_record_context(record)
-        candidate_urls = extract_candidate_urls(record)
+        candidate_urls, context = scan_record(record)
         return SessionStartResponse(
             session_id=session_id,
             record_id=state.record_id,
@@ -0,0 +1,98 @@
+"""SQL executor wrapper that coalesces concurrent primary-key lookups.
+
+When many questions are answered concurrently (for example a ticket batch
+processed from a thread pool), each `QueryAgent` issues the same
+`SELECT * FROM <table> WHERE <pk> = ? LIMIT 1` statement with a different
+record id. `BatchingSQLExecutor` recognises that statement, queues the record id
+for a short window, and resolves every waiter from a single
+`SELECT * FROM <table> WHERE <pk> IN (?, ?, ...)` round trip. Any other statement
+is forwarded to the wrapped executor unchanged.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Sequence
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from typing import Any
+
+from src.agents.query_agent import SQLExecutor
+
+
+@dataclass(slots=True)
+class BatchingSQLExecutor:
+    """Debounces point lookups into batched `IN (...)` queries."""
+
+    inner: SQLExecutor
+    table_name: str = "dataset"
+    primary_key_column: str = "BRIZO_ID"
+    delay_seconds: float = 0.005
+    max_batch_size: int = 64
+    _pending: dict[str, Future[dict[str, Any] | None]] = field(
+        init=False, repr=False, default_factory=dict
+    )
+    _timer: threading.Timer | None = field(init=False, repr=False, default=None)
+    _lock: threading.Lock = field(init=False, repr=False, default_factory=threading.Lock)
+
+    @property
+    def point_lookup_statement(self) -> str:
+        return f"SELECT * FROM {self.table_name} WHERE {self.primary_key_column} = ? LIMIT 1"
+
+    def run(self, statement: str, parameters: Sequence[Any] = ()) -> list[dict[str, Any]]:
+        if statement == self.point_lookup_statement and len(parameters) == 1:
+            row = self.fetch(str(parameters[0]))
+            return [row] if row is not None else []
+        return self.inner.run(statement, parameters)
+
+    def fetch(self, record_id: str) -> dict[str, Any] | None:
+        """Return the row for *record_id*, sharing a round trip with concurrent callers."""
+
+        flush_now = False
+        with self._lock:
+            future = self._pending.get(record_id)
+            if future is None:
+                future = Future()
+                self._pending[record_id] = future
+            if len(self._pending) >= self.max_batch_size:
+                flush_now = True
+            elif self._timer is None:
+                self._timer = threading.Timer(self.delay_seconds, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+        if flush_now:
+            self.flush()
+        return future.result()
+
+    def flush(self) -> None:
+        """Issue one query for every queued record id and resolve the waiters."""
+
+        with self._lock:
+            batch = self._pending
+            self._pending = {}
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+        if not batch:
+            return
+
+        record_ids = list(batch)
+        placeholders = ", ".join("?" for _ in record_ids)
+        statement = (
+            f"SELECT * FROM {self.table_name} "
+            f"WHERE {self.primary_key_column} IN ({placeholders})"
+        )
+        try:
+            rows = self.inner.run(statement, record_ids)
+        except Exception as exc:
+            for future in batch.values():
+                future.set_exception(exc)
+            return
+
+        by_id: dict[str, dict[str, Any]] = {}
+        for row in rows:
+            key = row.get(self.primary_key_column)
+            if key is not None:
+                by_id.setdefault(str(key), row)
+        for record_id, future in batch.items():
+            future.set_result(by_id.get(record_id))
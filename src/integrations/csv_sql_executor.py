@@ -5,8 +5,10 @@ subset of SQL statements. It is designed for prototyping the query bot without a
 full database. Supported queries must match the pattern:
 
     SELECT <columns> FROM <table> WHERE <column> = '<value>' [LIMIT <n>];
+    SELECT <columns> FROM <table> WHERE <column> IN ('<value>', ...) [LIMIT <n>];
 
 - `<columns>` can be `*` or a comma-separated list of column names.
+- Each `<value>` may be a `?` placeholder bound from the `parameters` argument.
 - Table and column names are matched case-insensitively against the CSV header.
 - The optional `LIMIT` clause restricts the number of returned rows.
 
@@ -18,16 +20,20 @@ from __future__ import annotations
 
 import csv
 import re
+import sys
+from collections.abc import Sequence
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
 _SELECT_RE = re.compile(
     r"^\s*select\s+(?P<columns>\*|[\w\s,]+)\s+from\s+(?P<table>\w+)\s+"
-    r"where\s+(?P<where_col>\w+)\s*=\s*'(?P<where_val>[^']*)'"
+    r"where\s+(?P<where_col>\w+)\s*(?:=\s*(?P<where_val>'[^']*'|\?)|in\s*\((?P<where_in>(?:'[^']*'|[^)'])*)\))"
     r"(?:\s+limit\s+(?P<limit>\d+))?\s*;?\s*$",
     flags=re.IGNORECASE,
 )
+# One entry of an IN list: a quoted literal or placeholder, then a comma or the end.
+_IN_ITEM_RE = re.compile(r"\s*(?P<token>'[^']*'|\?)\s*(?P<sep>,|$)")
 
 
 @dataclass(slots=True)
@@ -45,7 +51,7 @@ class CsvSQLExecutor:
         self._path = Path(self.csv_path).expanduser()
         self.refresh()
 
-    def run(self, statement: str) -> list[dict[str, Any]]:
+    def run(self, statement: str, parameters: Sequence[Any] = ()) -> list[dict[str, Any]]:
         match = _SELECT_RE.match(statement)
         if not match:
             raise NotImplementedError("Only simple SELECT equality queries are supported")
@@ -56,10 +62,12 @@ class CsvSQLExecutor:
 
         where_col = self._resolve_field(match.group("where_col"))
         where_val = match.group("where_val")
+        tokens = [where_val] if where_val is not None else _split_in_list(match.group("where_in"))
+        where_values = _bind_values(tokens, parameters)
         limit = match.group("limit")
         selected_columns = self._resolve_columns(match.group("columns"))
 
-        filtered = [row for row in self._rows if row.get(where_col) == where_val]
+        filtered = [row for row in self._rows if row.get(where_col) in where_values]
 
         if limit is not None:
             filtered = filtered[: int(limit)]
@@ -107,7 +115,10 @@ class CsvSQLExecutor:
             reader = csv.DictReader(handle)
             if reader.fieldnames is None:
                 raise ValueError("CSV file must include a header row")
-            fieldnames = list(reader.fieldnames)
+            # Interned header names make every row share the same key objects as
+            # the column names the agents look up, so dict probes hit on identity.
+            fieldnames = [sys.intern(name) for name in reader.fieldnames]
+            reader.fieldnames = fieldnames
             self._fieldnames = fieldnames
             self._field_map = {name.lower(): name for name in fieldnames}
             self._rows = [dict(row) for row in reader]
@@ -160,7 +171,7 @@ class CsvSQLExecutor:
         if not name:
             raise ValueError("Column name must be provided")
 
-        canonical = str(name)
+        canonical = sys.intern(str(name))
         if canonical in self._fieldnames:
             return
 
@@ -173,3 +184,40 @@ class CsvSQLExecutor:
 
         self._write_rows()
         self.refresh()
+
+
+def _split_in_list(raw_values: str) -> list[str]:
+    """Split an IN list into quoted literals and ``?`` placeholders.
+
+    Literals may contain commas or parentheses; anything else is rejected.
+    """
+
+    tokens: list[str] = []
+    position = 0
+    while position < len(raw_values) or not tokens:
+        item = _IN_ITEM_RE.match(raw_values, position)
+        if item is None or (item.group("sep") and item.end() == len(raw_values)):
+            raise NotImplementedError(f"Unsupported WHERE value list '{raw_values}'")
+        tokens.append(item.group("token"))
+        position = item.end()
+    return tokens
+
+
+def _bind_values(tokens: Sequence[str], parameters: Sequence[Any]) -> set[str]:
+    """Resolve quoted literals and ``?`` placeholders from a WHERE clause."""
+
+    values: set[str] = set()
+    bound = 0
+    for token in tokens:
+        if token == "?":
+            if bound >= len(parameters):
+                raise ValueError("Statement has more placeholders than supplied parameters")
+            values.add(str(parameters[bound]))
+            bound += 1
+        elif len(token) > 1 and token[0] == token[-1] == "'":
+            values.add(token[1:-1])
+        else:
+            raise NotImplementedError(f"Unsupported WHERE value '{token}'")
+    if bound != len(parameters):
+        raise ValueError(f"Statement expects {bound} parameter(s), received {len(parameters)}")
+    return values
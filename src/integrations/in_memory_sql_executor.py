@@ -8,6 +8,7 @@ is still in development.
 
 from __future__ import annotations
 
+from collections.abc import Sequence
 from dataclasses import dataclass, field
 from typing import Any
 
@@ -18,12 +19,30 @@ class InMemorySQLExecutor:
 
     canned_results: dict[str, list[dict[str, Any]]] = field(default_factory=dict)
 
-    def run(self, statement: str) -> list[dict[str, Any]]:
-        """Return the canned result for the supplied SQL statement."""
+    def run(self, statement: str, parameters: Sequence[Any] = ()) -> list[dict[str, Any]]:
+        """Return the canned result for the supplied SQL statement.
 
-        return list(self.canned_results.get(statement, []))
+        Bound *parameters* are rendered into the statement as quoted literals so
+        canned results can be primed with the fully expanded SQL text.
+        """
+
+        return list(self.canned_results.get(_render(statement, parameters), []))
 
     def prime(self, statement: str, rows: list[dict[str, Any]]) -> None:
         """Register a canned response for a future `run` call."""
 
         self.canned_results[statement] = list(rows)
+
+
+def _render(statement: str, parameters: Sequence[Any]) -> str:
+    # Split once so a "?" inside a bound value is never mistaken for a placeholder.
+    pieces = statement.split("?")
+    if len(pieces) - 1 != len(parameters):
+        raise ValueError(
+            f"Statement expects {len(pieces) - 1} parameter(s), received {len(parameters)}"
+        )
+    rendered = [pieces[0]]
+    for value, piece in zip(parameters, pieces[1:], strict=True):
+        rendered.append("'" + str(value).replace("'", "''") + "'")
+        rendered.append(piece)
+    return "".join(rendered)
@@ -3,8 +3,9 @@
 from __future__ import annotations
 
 import importlib
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass, field
-from typing import Any, Iterable
+from typing import Any
 
 from src.integrations.openai_models import GPTResponseClient, OpenAIClientFactory
 
@@ -65,6 +66,33 @@ class OpenAIAgentAdapter:
                 messages=messages, max_output_tokens=max_output_tokens, tools=tools
             )
 
+    def can_stream(self) -> bool:
+        """Return whether ``stream`` would reach the same backend as ``generate``.
+
+        Streaming bypasses the Agents SDK session, so callers should only stream
+        while no agent session is active.
+        """
+
+        return not self._is_agent_ready()
+
+    def stream(
+        self,
+        *,
+        messages: Iterable[dict[str, str]],
+        max_output_tokens: int | None = None,
+        tools: list[dict[str, Any]] | None = None,
+    ) -> Iterator[str]:
+        """Stream output text deltas through the Responses API client.
+
+        The Agents SDK session API is request/response only, so streaming always
+        goes through the fallback client; check ``can_stream`` first to avoid
+        bypassing an active agent session.
+        """
+
+        return self.fallback.stream(
+            messages=list(messages), max_output_tokens=max_output_tokens, tools=tools
+        )
+
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
@@ -3,8 +3,9 @@
 from __future__ import annotations
 
 import os
+from collections.abc import Iterator, Sequence
 from dataclasses import dataclass, field
-from typing import Any, Sequence
+from typing import Any
 
 
 class OpenAIError(RuntimeError):
@@ -58,6 +59,43 @@ class GPTResponseClient:
         max_output_tokens: int | None = None,
         tools: list[dict[str, Any]] | None = None,
     ) -> Any:
+        return self.client.responses.create(
+            **self._build_payload(messages, max_output_tokens, tools)
+        )
+
+    def stream(
+        self,
+        *,
+        messages: Sequence[dict[str, str]],
+        max_output_tokens: int | None = None,
+        tools: list[dict[str, Any]] | None = None,
+    ) -> Iterator[str]:
+        """Yield output text deltas as they arrive.
+
+        Closing the generator early closes the underlying HTTP stream, so callers
+        that have what they need stop paying for the remaining tokens.
+        """
+
+        events = self.client.responses.create(
+            **self._build_payload(messages, max_output_tokens, tools), stream=True
+        )
+        try:
+            for event in events:
+                if getattr(event, "type", None) == "response.output_text.delta":
+                    delta = getattr(event, "delta", "")
+                    if delta:
+                        yield delta
+        finally:
+            close = getattr(events, "close", None)
+            if close is not None:
+                close()
+
+    def _build_payload(
+        self,
+        messages: Sequence[dict[str, str]],
+        max_output_tokens: int | None,
+        tools: list[dict[str, Any]] | None,
+    ) -> dict[str, Any]:
         payload: dict[str, Any] = {
             "model": self.model,
             "input": [
@@ -72,4 +110,4 @@ class GPTResponseClient:
             payload["max_output_tokens"] = max_output_tokens
         if tools:
             payload["tools"] = tools
-        return self.client.responses.create(**payload)
+        return payload
@@ -2,22 +2,35 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
-
+from collections.abc import Sequence
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
 from dataclasses import dataclass, field
 from typing import Any
 
-from src.agents.query_agent import MissingDataFlagger, QueryAgent, SQLExecutor
+from src.agents.query_agent import (
+    ColumnSelectionCache,
+    MissingDataFlagger,
+    QueryAgent,
+    SQLExecutor,
+)
+from src.core.answer_cache import InMemoryAnswerCache
 from src.core.observability import QueryObservationSink
+from src.integrations.openai_agent_sdk import OpenAIAgentAdapter
 
 
 @dataclass
 class _SQLExecutorStub(SQLExecutor):
     rows: list[dict[str, Any]]
     statements: list[str] = field(default_factory=list)
+    parameters: list[tuple[Any, ...]] = field(default_factory=list)
 
-    def run(self, statement: str) -> list[dict[str, Any]]:  # type: ignore[override]
+    def run(  # type: ignore[override]
+        self, statement: str, parameters: Sequence[Any] = ()
+    ) -> list[dict[str, Any]]:
         self.statements.append(statement)
+        self.parameters.append(tuple(parameters))
         return self.rows
 
 
@@ -81,7 +94,8 @@ def test_answer_question_returns_column_value() -> None:
     assert first_fact["concept"] == "business_name"
     assert first_fact["value"] == "Cafe Example"
     assert result["answer_origin"] == "dataset"
-    assert executor.statements == ["SELECT * FROM dataset WHERE BRIZO_ID = 'abc' LIMIT 1"]
+    assert executor.statements == ["SELECT * FROM dataset WHERE BRIZO_ID = ? LIMIT 1"]
+    assert executor.parameters == [("abc",)]
     assert flagger.calls == []
 
 
@@ -152,6 +166,8 @@ def test_answer_question_emits_observability_events() -> None:
     assert "columns_inferred" in events
     assert "facts_ready" in events
     assert events.count("question_resolved") == 1
+    facts_payload = next(payload for _, event, payload in logger.events if event == "facts_ready")
+    assert facts_payload == {"record_id": "abc", "concepts": ["business_name"]}
 
 
 class _LLMResponse:
@@ -317,3 +333,555 @@ def test_query_agent_incorporates_scraper_findings_with_llm() -> None:
     assert follow_up["answer_origin"] == "scraper"
     assert follow_up["fact_sources"] == {"employee_count": "https://example.com/report"}
     assert "Derived" in facts[0].get("notes", "")
+
+
+def test_query_agent_matches_overlapping_synonyms_in_row_order() -> None:
+    rows = [
+        {
+            "BRIZO_ID": "abc",
+            "LOCATION_STATE_CODE": "CA",
+            "LOCATION_CITY": "Oakland",
+            "BUSINESS_NAME": "Cafe Example",
+        }
+    ]
+    agent, _, _ = _make_agent(rows)
+
+    first = agent.answer_question(
+        ticket_id="T-syn", question="Which city and state code is the name in?", record_id="abc"
+    )
+    second = agent.answer_question(ticket_id="T-syn", question="What is the city?", record_id="abc")
+
+    concepts = [fact["concept"] for fact in first["facts"]]
+    assert concepts == ["location_state_code", "location_city", "business_name"]
+    assert [fact["concept"] for fact in second["facts"]] == ["location_city"]
+    other_agent, _, _ = _make_agent(rows)
+    assert other_agent._synonym_index(rows[0]) is agent._synonym_index(rows[0])
+
+
+def test_query_agent_prefers_populated_columns_within_budget() -> None:
+    rows = [
+        {
+            "BRIZO_ID": "abc",
+            "BUSINESS_NAME": "",
+            "LOCATION_CITY": "Oakland",
+        }
+    ]
+    agent, _, flagger = _make_agent(rows)
+    agent.max_columns = 1
+
+    result = agent.answer_question(
+        ticket_id="T-budget", question="What is the name and city?", record_id="abc"
+    )
+
+    assert result["status"] == "answered"
+    assert [fact["concept"] for fact in result["facts"]] == ["location_city"]
+    assert flagger.calls == []
+
+
+def test_query_agent_prompt_projects_selected_and_context_columns() -> None:
+    rows = [
+        {
+            "BRIZO_ID": "abc",
+            "BUSINESS_NAME": "",
+            "LOCATION_CITY": "",
+            "LOCATION_COUNTRY": "US",
+            "LINK": "example.com",
+            "CHAIN_NAME": "x" * 2000,
+        }
+    ]
+    llm = _LLMClientStub(responses=['{"columns": ["BUSINESS_NAME"]}'])
+    agent, _, _ = _make_agent(rows, llm_client=llm)
+
+    agent.answer_question(ticket_id="T-trim", question="What is the name?", record_id="abc")
+
+    record_prompt = llm.calls[1]["messages"][1]["content"]
+    assert '"BUSINESS_NAME":""' in record_prompt
+    assert "Columns without a stored value: BUSINESS_NAME" in record_prompt
+    assert '"LOCATION_COUNTRY":"US"' in record_prompt
+    assert "LOCATION_CITY" not in record_prompt
+    assert "example.com" not in record_prompt
+    assert "x" * 600 not in record_prompt
+
+
+def test_query_agent_stops_reading_response_after_first_usable_payload() -> None:
+    class _ExplodingBlock:
+        @property
+        def content(self) -> Any:
+            raise AssertionError("later output blocks should not be read")
+
+    response = _LLMResponse(
+        '{"status": "answered", "facts": [{"concept": "city", "value": "Florence"}]}'
+    )
+    response.output.append(_ExplodingBlock())
+    agent, _, _ = _make_agent([])
+
+    facts = agent._extract_facts_from_response(response)
+
+    assert [fact["value"] for fact in facts] == ["Florence"]
+
+
+def test_query_agent_reuses_serialized_row_for_repeated_prompts() -> None:
+    row = {"BRIZO_ID": "abc", "BUSINESS_NAME": "", "LOCATION_CITY": "Florence"}
+    agent, _, _ = _make_agent([row])
+
+    agent._build_prompt("What is the business name?", row, ["BUSINESS_NAME"])
+    cached = agent._row_json_cache
+
+    agent._build_prompt("Business name again?", row, ["BUSINESS_NAME"])
+
+    assert agent._row_json_cache is cached
+    assert agent._serialize_row(row, ["BUSINESS_NAME"]) is agent._serialize_row(
+        row, ["BUSINESS_NAME"]
+    )
+    assert agent._serialize_row(row) != agent._serialize_row(row, ["BUSINESS_NAME"])
+
+
+def test_query_agent_matches_column_tokens_in_wide_schema() -> None:
+    row: dict[str, Any] = {f"FILLER_FIELD_{index}": "x" for index in range(500)}
+    row.update({"BRIZO_ID": "abc", "ANNUAL_REVENUE": "1M"})
+    agent, _, _ = _make_agent([row])
+
+    result = agent.answer_question(
+        ticket_id="T-wide", question="Revenue figure, annual?", record_id="abc"
+    )
+
+    assert result["status"] == "answered"
+    assert [fact["value"] for fact in result["facts"]] == ["1M"]
+    index = agent._synonym_index(row)
+    assert index.token_matches(frozenset({"revenue", "figure", "annual"})) == {501}
+    assert index.token_matches(frozenset({"revenue"})) == set()
+
+
+def test_query_agent_answer_many_preserves_input_order() -> None:
+    rows = [{"BRIZO_ID": "abc", "BUSINESS_NAME": "Cafe Example", "LOCATION_CITY": "Florence"}]
+    agent, _, _ = _make_agent(rows)
+    agent.max_concurrency = 2
+    questions = [
+        {"ticket_id": f"T-{index}", "question": question, "record_id": "abc"}
+        for index, question in enumerate(
+            ["What is the business name?", "Which city?", "What is the business name?"]
+        )
+    ]
+
+    results = asyncio.run(agent.answer_many(questions))
+
+    assert [result["ticket_id"] for result in results] == ["T-0", "T-1", "T-2"]
+    assert [result["facts"][0]["value"] for result in results] == [
+        "Cafe Example",
+        "Florence",
+        "Cafe Example",
+    ]
+
+
+def test_query_agent_shares_column_lookup_per_schema() -> None:
+    agent, _, _ = _make_agent([])
+    other_agent, _, _ = _make_agent([])
+
+    lookup = agent._column_lookup(["Business Name", "CITY"])
+
+    assert lookup["BUSINESS_NAME"] == "Business Name"
+    assert other_agent._column_lookup({"CITY", "Business Name"}) is lookup
+
+
+def test_query_agent_reuses_cached_row_until_invalidated() -> None:
+    rows = [{"BRIZO_ID": "abc", "BUSINESS_NAME": "Cafe Example"}]
+    agent, executor, _ = _make_agent(rows)
+
+    for _ in range(2):
+        agent.answer_question(
+            ticket_id="T-cache", question="What is the business name?", record_id="abc"
+        )
+    assert len(executor.statements) == 1
+
+    agent.invalidate("abc")
+    agent.answer_question(
+        ticket_id="T-cache", question="What is the business name?", record_id="abc"
+    )
+    assert executor.statements[1:] == executor.statements[:1]
+
+
+def test_query_agent_row_cache_evicts_least_recently_used() -> None:
+    agent, executor, _ = _make_agent([{"BRIZO_ID": "abc"}])
+    agent.row_cache_size = 1
+
+    agent._fetch_record("T-lru", "abc")
+    agent._fetch_record("T-lru", "def")
+    agent._fetch_record("T-lru", "abc")
+
+    assert executor.parameters == [("abc",), ("def",), ("abc",)]
+
+
+def test_query_agent_answer_questions_fetches_records_in_one_query() -> None:
+    rows = [
+        {"BRIZO_ID": "abc", "BUSINESS_NAME": "Cafe Example"},
+        {"BRIZO_ID": "def", "BUSINESS_NAME": "Bistro Sample"},
+    ]
+    agent, executor, _ = _make_agent(rows)
+    questions = [
+        {"ticket_id": "T-1", "question": "What is the business name?", "record_id": "abc"},
+        {"ticket_id": "T-2", "question": "What is the business name?", "record_id": "def"},
+        {"ticket_id": "T-3", "question": "Business name?", "record_id": "abc"},
+    ]
+
+    results = agent.answer_questions(questions)
+
+    assert executor.statements == ["SELECT * FROM dataset WHERE BRIZO_ID IN (?, ?)"]
+    assert executor.parameters == [("abc", "def")]
+    assert [result["facts"][0]["value"] for result in results] == [
+        "Cafe Example",
+        "Bistro Sample",
+        "Cafe Example",
+    ]
+
+
+def test_query_agent_prefetch_keeps_first_row_for_duplicate_keys() -> None:
+    rows = [
+        {"BRIZO_ID": "abc", "BUSINESS_NAME": "Cafe Example"},
+        {"BRIZO_ID": "def", "BUSINESS_NAME": "Bistro Sample"},
+        {"BRIZO_ID": "abc", "BUSINESS_NAME": "Duplicate Row"},
+    ]
+    agent, _, _ = _make_agent(rows)
+    questions = [
+        {"ticket_id": "T-1", "question": "What is the business name?", "record_id": "abc"},
+        {"ticket_id": "T-2", "question": "What is the business name?", "record_id": "def"},
+    ]
+
+    results = agent.answer_questions(questions)
+
+    assert results[0]["facts"][0]["value"] == "Cafe Example"
+
+
+def test_decode_json_strings_yields_embedded_objects_lazily() -> None:
+    text = 'Here you go: {"status": "answered"} and then {"broken": ' + "x" * 50
+
+    payloads = QueryAgent._decode_json_strings(text)
+
+    assert next(payloads) == {"status": "answered"}
+
+
+def test_query_agent_skips_fact_llm_call_when_columns_have_values() -> None:
+    rows = [{"BRIZO_ID": "abc", "BUSINESS_NAME": "Cafe Example"}]
+    llm = _LLMClientStub(responses=['{"columns": ["BUSINESS_NAME"]}'])
+    agent, _, _ = _make_agent(rows, llm_client=llm)
+
+    result = agent.answer_question(
+        ticket_id="T-direct", question="What is the name?", record_id="abc"
+    )
+
+    assert result["answer_origin"] == "dataset"
+    assert len(llm.calls) == 1
+
+
+def test_query_agent_serves_repeat_questions_from_answer_cache() -> None:
+    rows = [{"BRIZO_ID": "abc", "BUSINESS_NAME": ""}]
+    cache = InMemoryAnswerCache()
+    first_llm = _LLMClientStub(responses=['{"columns": ["BUSINESS_NAME"]}'])
+    first_agent, _, _ = _make_agent(rows, llm_client=first_llm)
+    first_agent.answer_cache = cache
+    first_agent.answer_question(
+        ticket_id="T-1", question="What is the business name?", record_id="abc"
+    )
+
+    second_llm = _LLMClientStub()
+    second_agent, _, _ = _make_agent(rows, llm_client=second_llm)
+    second_agent.answer_cache = cache
+    result = second_agent.answer_question(
+        ticket_id="T-2", question="what is the BUSINESS name", record_id="abc"
+    )
+
+    assert result["ticket_id"] == "T-2"
+    assert result["facts"][0]["value"] == "Example LLC"
+    assert second_llm.calls == []
+
+    rows[0]["BUSINESS_NAME"] = "Renamed"
+    third_agent, _, _ = _make_agent(rows, llm_client=_LLMClientStub())
+    third_agent.answer_cache = cache
+    refreshed = third_agent.answer_question(
+        ticket_id="T-3", question="What is the business name?", record_id="abc"
+    )
+    assert refreshed["facts"][0]["value"] == "Renamed"
+
+
+def test_query_agent_skips_answer_cache_for_unserialisable_rows() -> None:
+    rows = [{"BRIZO_ID": "abc", "BUSINESS_NAME": "Cafe Example", "TAGS": {"cafe", "bar"}}]
+    logger = _LoggerStub()
+    agent, _, _ = _make_agent(rows, logger=logger)
+    agent.answer_cache = InMemoryAnswerCache()
+
+    for ticket_id in ("T-1", "T-2"):
+        result = agent.answer_question(
+            ticket_id=ticket_id, question="What is the business name?", record_id="abc"
+        )
+        assert result["facts"][0]["value"] == "Cafe Example"
+
+    assert not any(event == "answer_cache_hit" for _, event, _ in logger.events)
+
+
+def test_follow_up_prompt_trims_wide_rows_to_relevant_columns() -> None:
+    row: dict[str, Any] = {f"METRIC_{index}": f"value-{index}" for index in range(60)}
+    row.update({"BRIZO_ID": "abc", "BUSINESS_NAME": "Cafe Example", "EMPLOYEE_COUNT": ""})
+    agent, _, _ = _make_agent([row])
+
+    prompt = agent._build_follow_up_prompt(
+        question="What is the employee count?",
+        row=row,
+        record_context=None,
+        findings=[],
+    )
+
+    user_content = prompt[1]["content"]
+    snapshot = user_content.split("Record snapshot: ", 1)[1].split("\n", 1)[0]
+    assert json.loads(snapshot) == {"EMPLOYEE_COUNT": "", "BUSINESS_NAME": "Cafe Example"}
+    assert "METRIC_59" in user_content
+
+
+def test_response_texts_skip_duplicate_output_text() -> None:
+    response = _LLMResponse('{"columns": ["CITY"]}')
+    response.output_text = ' {"columns": ["CITY"]}\n'
+    response.text = ["", "other"]
+
+    assert list(QueryAgent._iter_response_texts(response)) == ['{"columns": ["CITY"]}', "other"]
+
+
+def test_decode_json_strings_strips_code_fences() -> None:
+    fenced = '```json\n{"status": "answered"}\n```'
+
+    assert list(QueryAgent._decode_json_strings(fenced)) == [{"status": "answered"}]
+    assert list(QueryAgent._decode_json_strings('```\n[{"a": 1}, 2]```')) == [{"a": 1}]
+
+
+class _StreamingLLMClientStub(_LLMClientStub):
+    def __init__(self, chunks: list[str], **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self.chunks = chunks
+        self.closed = False
+
+    def stream(self, *, messages: list[dict[str, str]], **_: Any):
+        self.calls.append({"messages": messages, "stream": True})
+        try:
+            yield from self.chunks
+            raise AssertionError("stream consumed past the first usable payload")
+        finally:
+            self.closed = True
+
+
+def test_query_agent_closes_stream_once_facts_decode() -> None:
+    rows = [{"BRIZO_ID": "abc", "BUSINESS_NAME": ""}]
+    llm = _StreamingLLMClientStub(
+        chunks=[
+            '{"status": "answered", "facts": [{"concept": "business_name", ',
+            '"value": "Example LLC"}]}',
+        ],
+        responses=['{"columns": ["BUSINESS_NAME"]}'],
+    )
+    agent, _, _ = _make_agent(rows, llm_client=llm)
+
+    result = agent.answer_question(
+        ticket_id="T-stream", question="What is the business name?", record_id="abc"
+    )
+
+    assert result["answer_origin"] == "llm"
+    assert result["facts"][0]["value"] == "Example LLC"
+    assert llm.closed
+
+
+def test_query_agent_stream_ignores_braces_inside_strings() -> None:
+    rows = [{"BRIZO_ID": "abc", "BUSINESS_NAME": ""}]
+    llm = _StreamingLLMClientStub(
+        chunks=[
+            'Here you go: {"status": "answered", "facts": [{"concept": "business_name", ',
+            '"value": "Example } \\"LLC\\" {"',
+            "}]}",
+        ],
+        responses=['{"columns": ["BUSINESS_NAME"]}'],
+    )
+    agent, _, _ = _make_agent(rows, llm_client=llm)
+
+    result = agent.answer_question(
+        ticket_id="T-stream-braces", question="What is the business name?", record_id="abc"
+    )
+
+    assert result["facts"][0]["value"] == 'Example } "LLC" {'
+    assert llm.closed
+
+
+class _BrokenStreamLLMClientStub(_LLMClientStub):
+    def stream(self, *, messages: list[dict[str, str]], **_: Any):
+        self.calls.append({"messages": messages, "stream": True})
+        yield '{"status": "answered", '
+        raise ConnectionError("stream dropped")
+
+
+def test_query_agent_falls_back_to_generate_when_stream_fails() -> None:
+    rows = [{"BRIZO_ID": "abc", "BUSINESS_NAME": ""}]
+    llm = _BrokenStreamLLMClientStub(responses=['{"columns": ["BUSINESS_NAME"]}'])
+    agent, _, _ = _make_agent(rows, llm_client=llm)
+
+    result = agent.answer_question(
+        ticket_id="T-stream-fail", question="What is the business name?", record_id="abc"
+    )
+
+    assert result["answer_origin"] == "llm"
+    assert result["facts"][0]["value"] == "Example LLC"
+    assert [call.get("stream", False) for call in llm.calls] == [False, True, False]
+
+
+class _SessionBoundLLMClientStub(_StreamingLLMClientStub):
+    def can_stream(self) -> bool:
+        return False
+
+
+def test_query_agent_does_not_stream_when_client_declines() -> None:
+    rows = [{"BRIZO_ID": "abc", "BUSINESS_NAME": ""}]
+    llm = _SessionBoundLLMClientStub(
+        chunks=["unused"], responses=['{"columns": ["BUSINESS_NAME"]}']
+    )
+    agent, _, _ = _make_agent(rows, llm_client=llm)
+
+    result = agent.answer_question(
+        ticket_id="T-no-stream", question="What is the business name?", record_id="abc"
+    )
+
+    assert result["facts"][0]["value"] == "Example LLC"
+    assert not any(call.get("stream") for call in llm.calls)
+
+
+def test_openai_agent_adapter_only_streams_without_agent_session() -> None:
+    adapter = OpenAIAgentAdapter(model="gpt-test", fallback=_LLMClientStub())
+    assert adapter.can_stream()
+
+    adapter.client = object()
+    adapter.agent_id = "agent"
+    adapter.session_id = "session"
+    assert not adapter.can_stream()
+
+
+class _RoutingLLMClientStub(_LLMClientStub):
+    def generate(self, *, messages: list[dict[str, str]], **_: Any) -> Any:  # type: ignore[override]
+        self.calls.append({"messages": messages})
+        if "Available columns" in messages[1]["content"]:
+            return _LLMResponse('{"columns": ["BUSINESS_NAME"]}')
+        return _LLMResponse(self._default_response)
+
+
+def test_query_agent_overlaps_fact_call_with_column_selection() -> None:
+    rows = [{"BRIZO_ID": "abc", "BUSINESS_NAME": ""}]
+    logger = _LoggerStub()
+    llm = _RoutingLLMClientStub()
+    agent, _, _ = _make_agent(rows, logger=logger, llm_client=llm)
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        agent.llm_executor = pool
+        result = agent.answer_question(
+            ticket_id="T-spec", question="What is the business name?", record_id="abc"
+        )
+
+    assert result["facts"][0]["value"] == "Example LLC"
+    # One column-selection call and one fact call, with no second fact request.
+    assert sorted("Available columns" in call["messages"][1]["content"] for call in llm.calls) == [
+        False,
+        True,
+    ]
+    events = [event for _, event, _ in logger.events]
+    assert "speculative_facts_used" in events
+    assert events.count("llm_facts") == 1
+
+
+class _InlineExecutor(Executor):
+    def submit(self, fn, /, *args, **kwargs):  # type: ignore[override]
+        future: Future[Any] = Future()
+        future.set_result(fn(*args, **kwargs))
+        return future
+
+
+def test_query_agent_logs_discarded_speculation_instead_of_its_facts() -> None:
+    rows = [{"BRIZO_ID": "abc", "BUSINESS_NAME": "", "LOCATION_CITY": ""}]
+    logger = _LoggerStub()
+    agent, _, _ = _make_agent(rows, logger=logger, llm_client=_RoutingLLMClientStub())
+    agent.llm_executor = _InlineExecutor()
+
+    result = agent.answer_question(
+        ticket_id="T-discard", question="What is the city?", record_id="abc"
+    )
+
+    assert result["facts"][0]["concept"] == "business_name"
+    events = [event for _, event, _ in logger.events]
+    assert events.count("llm_facts") == 1
+    discarded = next(
+        payload for _, event, payload in logger.events if event == "speculative_facts_discarded"
+    )
+    assert discarded == {"columns": ["LOCATION_CITY"], "fact_count": 1}
+
+
+def test_query_agent_reuses_column_selection_for_recurring_questions() -> None:
+    rows = [{"BRIZO_ID": "abc", "BUSINESS_NAME": "Cafe Example"}]
+    logger = _LoggerStub()
+    llm = _LLMClientStub(responses=['{"columns": ["BUSINESS_NAME"]}'])
+    agent, _, _ = _make_agent(rows, logger=logger, llm_client=llm)
+
+    for record_id in ("abc", "def"):
+        result = agent.answer_question(
+            ticket_id=f"T-{record_id}", question="What is the name?", record_id=record_id
+        )
+        assert result["facts"][0]["value"] == "Cafe Example"
+
+    assert len(llm.calls) == 1
+    assert [event for _, event, _ in logger.events].count("columns_selected_cached") == 1
+
+
+def test_follow_up_prompt_omits_unrelated_empty_columns() -> None:
+    row = {
+        "BRIZO_ID": "abc",
+        "BUSINESS_NAME": "Cafe Example",
+        "EMPLOYEE_COUNT": "",
+        "FAX_NUMBER": "",
+    }
+    agent, _, _ = _make_agent([row])
+
+    prompt = agent._build_follow_up_prompt(
+        question="What is the employee count?",
+        row=row,
+        record_context=None,
+        findings=[],
+    )
+
+    user_content = prompt[1]["content"]
+    snapshot = json.loads(user_content.split("Record snapshot: ", 1)[1].split("\n", 1)[0])
+    assert snapshot == {"EMPLOYEE_COUNT": "", "BRIZO_ID": "abc", "BUSINESS_NAME": "Cafe Example"}
+    assert "FAX_NUMBER" in user_content
+
+
+def test_concept_helpers_are_stable_for_repeated_inputs() -> None:
+    assert QueryAgent._column_to_concept("LOCATION_CITY") == "location_city"
+    assert QueryAgent._column_to_concept("LOCATION_CITY") == "location_city"
+    assert QueryAgent._canonicalise_concept(" Business-Name ") == "business_name"
+    assert QueryAgent._canonicalise_concept("   ") == ""
+
+
+def test_normalize_column_candidates_dedupes_in_first_seen_order() -> None:
+    agent, _, _ = _make_agent([])
+    lookup = agent._column_lookup(["BUSINESS_NAME", "LOCATION_CITY"])
+
+    resolved = agent._normalize_column_candidates(
+        ["business name", "location_city", "BUSINESS_NAME", " ", "notes"], lookup
+    )
+
+    assert resolved == ["BUSINESS_NAME", "LOCATION_CITY", "notes"]
+
+
+def test_query_agents_share_an_injected_column_selection_cache() -> None:
+    rows = [{"BRIZO_ID": "abc", "BUSINESS_NAME": "Cafe Example"}]
+    cache: ColumnSelectionCache = {}
+    first_llm = _LLMClientStub(responses=['{"columns": ["BUSINESS_NAME"]}'])
+    second_llm = _LLMClientStub(responses=['{"columns": ["BUSINESS_NAME"]}'])
+
+    for llm in (first_llm, second_llm):
+        agent, _, _ = _make_agent(rows, llm_client=llm)
+        agent.column_selection_cache = cache
+        result = agent.answer_question(
+            ticket_id="T-shared", question="What is the name?", record_id="abc"
+        )
+        assert result["facts"][0]["value"] == "Cafe Example"
+
+    assert len(first_llm.calls) == 1
+    assert second_llm.calls == []
@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from typing import Any
 
-from src.agents.schema_agent import SchemaAgent
+from src.agents.schema_agent import ProposalCache, SchemaAgent
 
 
 @dataclass
@@ -76,15 +77,81 @@ def test_schema_agent_handles_no_unknown_fields() -> None:
 
 def test_schema_agent_uses_llm_proposals() -> None:
     writer = _MigrationWriterStub()
-    llm = _LLMStub('[{"name": "engagement_score", "data_type": "numeric", "nullable": false, "description": "Score from 0-1"}]')
+    llm = _LLMStub(
+        '[{"name": "engagement_score", "data_type": "numeric", "nullable": false, "description": "Score from 0-1"}]'
+    )
     agent = SchemaAgent(migration_writer=writer, llm_client=llm)
 
     proposal = agent.propose_change(
         ticket_id="T-llm",
-        evidence_summary={
-            "unmatched_facts": [{"concept": "Engagement Score", "value": 0.42}]
-        },
+        evidence_summary={"unmatched_facts": [{"concept": "Engagement Score", "value": 0.42}]},
     )
 
     assert proposal["columns"][0]["name"] == "ENGAGEMENT_SCORE"
     assert llm.calls
+
+
+def test_schema_agent_normalizes_names_to_upper_snake_case() -> None:
+    name = SchemaAgent._normalize_name("  Foot-traffic score ")
+
+    assert name == "FOOT_TRAFFIC_SCORE"
+    assert name is SchemaAgent._normalize_name("foot traffic-score")
+
+
+def test_schema_agent_infers_sql_types_including_subclasses() -> None:
+    assert SchemaAgent._infer_sql_type(True) == "BOOLEAN"
+    assert SchemaAgent._infer_sql_type(3) == "INTEGER"
+    assert SchemaAgent._infer_sql_type(0.5) == "NUMERIC"
+    assert SchemaAgent._infer_sql_type(OrderedDict(a=1)) == "JSONB"
+    assert SchemaAgent._infer_sql_type("text") == "TEXT"
+
+
+def test_schema_agent_reuses_llm_proposals_for_repeat_fields() -> None:
+    writer = _MigrationWriterStub()
+    llm = _LLMStub('[{"name": "seating", "data_type": "integer", "description": "Seats"}]')
+    agent = SchemaAgent(migration_writer=writer, llm_client=llm)
+    evidence = {"unknown_fields": {"seating": 40}}
+
+    first = agent.propose_change(ticket_id="T-a", evidence_summary=evidence)
+    second = agent.propose_change(ticket_id="T-b", evidence_summary=evidence)
+
+    assert len(llm.calls) == 1
+    assert first["columns"] == second["columns"]
+
+
+def test_schema_agents_share_an_injected_proposal_cache() -> None:
+    cache: ProposalCache = {}
+    evidence = {"unknown_fields": {"seating": 40}}
+    text = '[{"name": "seating", "data_type": "integer", "description": "Seats"}]'
+    first_llm, second_llm = _LLMStub(text), _LLMStub(text)
+
+    for llm in (first_llm, second_llm):
+        agent = SchemaAgent(
+            migration_writer=_MigrationWriterStub(), llm_client=llm, proposal_cache=cache
+        )
+        agent.propose_change(ticket_id="T-shared", evidence_summary=evidence)
+
+    assert len(first_llm.calls) == 1
+    assert second_llm.calls == []
+
+
+def test_schema_agent_skips_llm_for_small_numeric_gaps() -> None:
+    writer = _MigrationWriterStub()
+    llm = _LLMStub('[{"name": "unused", "data_type": "text"}]')
+    agent = SchemaAgent(migration_writer=writer, llm_client=llm, llm_threshold=3)
+
+    numeric = agent.propose_change(
+        ticket_id="T-num", evidence_summary={"unknown_fields": {"seat count": 40}}
+    )
+    textual = agent.propose_change(
+        ticket_id="T-text", evidence_summary={"unknown_fields": {"opened": "2021-05-01"}}
+    )
+
+    assert numeric["columns"][0] == {
+        "name": "SEAT_COUNT",
+        "data_type": "INTEGER",
+        "nullable": True,
+        "description": "Inferred from sample value 40",
+    }
+    assert textual["columns"][0]["name"] == "UNUSED"
+    assert len(llm.calls) == 1
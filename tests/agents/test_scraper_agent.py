@@ -3,11 +3,14 @@
 from __future__ import annotations
 
 import json
+import threading
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
-from src.agents.scraper_agent import ScraperAgent, SearchClient
+import pytest
+
+from src.agents.scraper_agent import PlanCache, ScraperAgent, SearchClient
 from src.core.evidence import EvidenceSink, JSONLEvidenceSink
 from src.core.observability import ScraperObservationSink
 
@@ -183,6 +186,7 @@ def test_candidate_urls_influence_tasks() -> None:
     assert "google" in topics
     assert any("pigglywiggly.com" in topic for topic in topics)
     assert any("facebook.com" in topic for topic in topics)
+    assert not any("internal" in topic for topic in topics)
 
 
 def test_company_context_injected_into_queries() -> None:
@@ -203,7 +207,7 @@ def test_company_context_injected_into_queries() -> None:
 
 def test_llm_placeholders_replaced_with_company() -> None:
     llm = _LLMStub(
-        "LinkedIn company page|site:linkedin.com/company \"{Company Name}\"|Check LinkedIn headcount"
+        'LinkedIn company page|site:linkedin.com/company "{Company Name}"|Check LinkedIn headcount'
     )
     agent = ScraperAgent(
         search_client=_SearchClientStub(responses={}),
@@ -219,3 +223,158 @@ def test_llm_placeholders_replaced_with_company() -> None:
 
     assert any("Piggly Wiggly" in task.query for task in tasks if "linkedin" in task.query.lower())
     assert llm.calls
+
+
+@dataclass
+class _BarrierSearchClient(SearchClient):
+    barrier: threading.Barrier
+
+    def search(self, query: str, *, limit: int | None = None) -> list[dict[str, Any]]:  # type: ignore[override]
+        # Blocks until both searches are in flight, so a serial loop would time out.
+        self.barrier.wait()
+        return [{"url": f"https://{query.rsplit(maxsplit=1)[-1]}.test"}]
+
+
+def test_execute_plan_runs_searches_concurrently_in_task_order() -> None:
+    agent = ScraperAgent(
+        search_client=_BarrierSearchClient(barrier=threading.Barrier(2, timeout=5)),
+        evidence_sink=_SinkStub(),
+    )
+
+    outcome = agent.execute_plan(
+        ticket_id="T-par",
+        question="What is the city?",
+        missing_facts={"missing_columns": ["LOCATION_CITY"]},
+    )
+
+    assert [finding["topic"] for finding in outcome.findings] == ["google", "LOCATION_CITY"]
+
+
+@dataclass
+class _BatchSearchClientStub(_SearchClientStub):
+    batches: list[list[str]] = field(default_factory=list)
+
+    def search_many(
+        self, queries: list[str], *, limit: int | None = None
+    ) -> list[list[dict[str, Any]]]:
+        self.batches.append(list(queries))
+        return [self.responses.get(query, [])[: limit or None] for query in queries]
+
+
+def test_execute_plan_prefers_batched_search_when_available() -> None:
+    query = "What is the business name? business name"
+    client = _BatchSearchClientStub(responses={query: [{"url": "https://example.org"}]})
+    agent = ScraperAgent(search_client=client, evidence_sink=_SinkStub())
+
+    outcome = agent.execute_plan(
+        ticket_id="T-batch",
+        question="What is the business name?",
+        missing_facts={"missing_columns": ["BUSINESS_NAME"]},
+    )
+
+    assert len(client.batches) == 1 and query in client.batches[0]
+    assert client.queries == []
+    assert outcome.successful_searches[0]["topic"] == "BUSINESS_NAME"
+
+
+@dataclass
+class _ShortBatchSearchClientStub(_SearchClientStub):
+    def search_many(
+        self, queries: list[str], *, limit: int | None = None
+    ) -> list[list[dict[str, Any]]]:
+        return [[] for _ in queries[1:]]
+
+
+def test_execute_plan_rejects_short_batched_results() -> None:
+    agent = ScraperAgent(
+        search_client=_ShortBatchSearchClientStub(responses={}), evidence_sink=_SinkStub()
+    )
+
+    with pytest.raises(ValueError, match="result lists"):
+        agent.execute_plan(
+            ticket_id="T-short",
+            question="What is the business name?",
+            missing_facts={"missing_columns": ["BUSINESS_NAME"]},
+        )
+
+
+def test_plan_research_drops_duplicate_tasks() -> None:
+    llm = _LLMStub("BUSINESS_NAME | What is the business  name? business NAME | From the LLM")
+    logger = _ScraperLoggerStub()
+    agent = ScraperAgent(
+        search_client=_SearchClientStub(responses={}),
+        evidence_sink=_SinkStub(),
+        logger=logger,
+        llm_client=llm,
+    )
+
+    tasks = agent.plan_research(
+        question="What is the business name?",
+        missing_facts={"missing_columns": ["BUSINESS_NAME"]},
+        ticket_id="T-dup",
+    )
+
+    assert [task.topic for task in tasks] == ["google", "BUSINESS_NAME"]
+    assert tasks[1].description == "From the LLM"
+    plan_payload = next(
+        payload for _, event, payload in logger.events if event == "scrape_plan_created"
+    )
+    assert plan_payload["duplicates_dropped"] == 1
+
+
+def test_llm_plan_is_reused_for_repeat_gaps() -> None:
+    llm = _LLMStub("{company} | {company} opening hours | Official hours")
+    agent = ScraperAgent(
+        search_client=_SearchClientStub(responses={}),
+        evidence_sink=_SinkStub(),
+        llm_client=llm,
+    )
+    missing = {"missing_columns": ["HOURS"], "record_context": {"BUSINESS_NAME": "Cafe"}}
+
+    first = agent.plan_research(question="When do they open?", missing_facts=missing)
+    second = agent.plan_research(question="When do they open?", missing_facts=missing)
+
+    assert len(llm.calls) == 1
+    assert [task.to_dict() for task in first] == [task.to_dict() for task in second]
+    assert any(task.query == "Cafe opening hours" for task in second)
+
+
+def test_scraper_agents_share_an_injected_plan_cache() -> None:
+    cache: PlanCache = {}
+    missing = {"missing_columns": ["HOURS"], "record_context": {"BUSINESS_NAME": "Cafe"}}
+    first_llm = _LLMStub("{company} | {company} opening hours | Official hours")
+    second_llm = _LLMStub("{company} | {company} opening hours | Official hours")
+
+    for llm in (first_llm, second_llm):
+        agent = ScraperAgent(
+            search_client=_SearchClientStub(responses={}),
+            evidence_sink=_SinkStub(),
+            llm_client=llm,
+            plan_cache=cache,
+        )
+        agent.plan_research(question="When do they open?", missing_facts=missing)
+
+    assert len(first_llm.calls) == 1
+    assert second_llm.calls == []
+
+
+@dataclass
+class _FailingSecondSearchClient(SearchClient):
+    def search(self, query: str, *, limit: int | None = None) -> list[dict[str, Any]]:  # type: ignore[override]
+        if query.startswith('"'):
+            return [{"url": "https://first.test"}]
+        raise RuntimeError("search backend unavailable")
+
+
+def test_execute_plan_persists_each_task_before_later_failures() -> None:
+    sink = _SinkStub()
+    agent = ScraperAgent(search_client=_FailingSecondSearchClient(), evidence_sink=sink)
+
+    with pytest.raises(RuntimeError):
+        agent.execute_plan(
+            ticket_id="T-crash",
+            question="What is the city?",
+            missing_facts={"missing_columns": ["LOCATION_CITY"]},
+        )
+
+    assert [entry["result"]["url"] for entry in sink.appended] == ["https://first.test"]
@@ -0,0 +1,30 @@
+"""Tests for the in-memory answer cache."""
+
+from __future__ import annotations
+
+from src.core.answer_cache import InMemoryAnswerCache
+
+
+def test_answer_cache_evicts_least_recently_used_entry() -> None:
+    cache = InMemoryAnswerCache(max_entries=2)
+    cache.put(("a", "q", 1), {"status": "answered"})
+    cache.put(("b", "q", 1), {"status": "answered"})
+
+    assert cache.get(("a", "q", 1)) is not None
+    cache.put(("c", "q", 1), {"status": "answered"})
+
+    assert cache.get(("b", "q", 1)) is None
+    assert cache.get(("a", "q", 1)) is not None
+
+
+def test_answer_cache_invalidates_every_entry_for_a_record() -> None:
+    cache = InMemoryAnswerCache()
+    cache.put(("a", "city", 1), {"status": "answered"})
+    cache.put(("a", "name", 2), {"status": "answered"})
+    cache.put(("b", "city", 1), {"status": "answered"})
+
+    cache.invalidate("a")
+
+    assert cache.get(("a", "city", 1)) is None
+    assert cache.get(("a", "name", 2)) is None
+    assert cache.get(("b", "city", 1)) is not None
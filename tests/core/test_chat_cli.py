@@ -2,13 +2,14 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable, Iterator, Sequence
 from dataclasses import dataclass, field
-from typing import Any, Callable, Iterator
+from typing import Any
 
 from src.agents.query_agent import MissingDataFlagger, SQLExecutor
 from src.agents.scraper_agent import ScrapeOutcome
-from src.core.dependencies import RunnerDependencies
 from src.core.chat import ChatCLI
+from src.core.dependencies import RunnerDependencies
 
 
 @dataclass
@@ -16,10 +17,12 @@ class _SQLExecutorStub(SQLExecutor):
     dataset: dict[str, dict[str, Any]]
     statements: list[str] = field(default_factory=list)
 
-    def run(self, statement: str) -> list[dict[str, Any]]:  # type: ignore[override]
+    def run(  # type: ignore[override]
+        self, statement: str, parameters: Sequence[Any] = ()
+    ) -> list[dict[str, Any]]:
         self.statements.append(statement)
         for record_id, row in self.dataset.items():
-            if record_id in statement:
+            if record_id in parameters:
                 return [row]
         return []
 
@@ -148,11 +151,13 @@ def test_chat_cli_supports_record_switch() -> None:
         "row-2": {"BRIZO_ID": "row-2", "BUSINESS_NAME": "Cafe Two"},
     }
     dependencies = _make_dependencies(dataset)
-    input_stub, prompts = _input_factory([
-        "/record row-2",
-        "What is the business name?",
-        "/exit",
-    ])
+    input_stub, prompts = _input_factory(
+        [
+            "/record row-2",
+            "What is the business name?",
+            "/exit",
+        ]
+    )
     outputs: list[str] = []
 
     cli = ChatCLI(
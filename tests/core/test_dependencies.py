@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import threading
 from pathlib import Path
 from typing import Any
 
@@ -46,6 +47,7 @@ def test_build_dependencies_uses_in_memory_when_no_csv(base_settings: Settings)
     assert deps.gpt_client is None
     assert deps.candidate_url_fields == []
     assert deps.dataset_columns == []
+    assert deps.answer_cache is not None
 
 
 def test_build_dependencies_uses_csv_path(
@@ -132,3 +134,23 @@ def test_candidate_url_fields_detected(
 
     assert set(deps.candidate_url_fields or []) == {"LINK", "YELP_LINK", "BRIZO_WEBSITE"}
     assert deps.dataset_columns == ["BRIZO_ID", "LINK", "YELP_LINK", "BRIZO_WEBSITE", "NOTES"]
+
+
+def test_build_dependencies_reuses_background_log_sinks(base_settings: Settings) -> None:
+    first = build_dependencies(base_settings)
+    threads = threading.active_count()
+
+    second = build_dependencies(base_settings)
+
+    assert second.query_logger is first.query_logger
+    assert second.scraper_logger is first.scraper_logger
+    assert threading.active_count() == threads
+
+
+def test_build_dependencies_shares_answer_cache(base_settings: Settings) -> None:
+    first = build_dependencies(base_settings)
+    second = build_dependencies(base_settings)
+
+    assert first.answer_cache is not None
+    assert second.answer_cache is first.answer_cache
+    assert second.column_selection_cache is first.column_selection_cache
@@ -27,3 +27,11 @@ def test_jsonl_evidence_sink_appends_lines(tmp_path: Path) -> None:
     assert len(lines) == expected_lines
     assert lines[0]["result"]["url"] == "https://example.com"
     assert all("timestamp" in entry for entry in lines)
+
+
+def test_jsonl_evidence_sink_skips_empty_batches(tmp_path: Path) -> None:
+    sink = JSONLEvidenceSink(base_dir=tmp_path)
+
+    sink.bulk_append(ticket_id="T-empty", payloads=iter(()))
+
+    assert list(tmp_path.glob("*-T-empty.jsonl")) == []
@@ -0,0 +1,19 @@
+"""Tests for the JSON helper module."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from src.core import json_utils
+
+
+def test_dumps_is_compact_and_keeps_unicode() -> None:
+    assert json_utils.dumps({"city": "Zürich", "rank": 1}) == '{"city":"Zürich","rank":1}'
+
+
+def test_loads_raises_stdlib_decode_error() -> None:
+    assert json_utils.loads('{"a": [1, 2]}') == {"a": [1, 2]}
+    with pytest.raises(json.JSONDecodeError):
+        json_utils.loads("not json")
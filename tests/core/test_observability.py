@@ -5,7 +5,7 @@ from __future__ import annotations
 import json
 from pathlib import Path
 
-from src.core.observability import JSONLQueryLogger, JSONLScraperLogger
+from src.core.observability import AsyncObservationSink, JSONLQueryLogger, JSONLScraperLogger
 
 
 def _load_events(path: Path) -> list[dict[str, str]]:
@@ -42,3 +42,53 @@ def test_jsonl_scraper_logger_appends_events(tmp_path: Path) -> None:
     assert events[0]["event"] == "scrape_task_started"
     assert events[1]["event"] == "scrape_task_completed"
     assert events[1]["result_count"] == 3
+
+
+def test_async_sink_forwards_events_after_flush(tmp_path: Path) -> None:
+    sink = AsyncObservationSink(inner=JSONLQueryLogger(base_dir=tmp_path))
+
+    sink.log_event("T-3", "question_received", {"record_id": "abc"})
+    sink.log_event("T-3", "answer_ready", {"columns": ["CITY"]})
+    sink.flush()
+
+    events = _load_events(next(tmp_path.glob("*-T-3.jsonl")))
+    assert [event["event"] for event in events] == ["question_received", "answer_ready"]
+    assert all("timestamp" in event for event in events)
+    assert sink.dropped == 0
+
+
+def test_jsonl_logger_writes_event_batches_in_order(tmp_path: Path) -> None:
+    logger = JSONLScraperLogger(base_dir=tmp_path)
+
+    logger.log_events(
+        "T-4",
+        [
+            ("scrape_task_started", {"topic": "CITY"}),
+            ("scrape_task_completed", {"result_count": 1}),
+        ],
+    )
+
+    events = _load_events(next(tmp_path.glob("*-T-4.jsonl")))
+    assert [event["event"] for event in events] == ["scrape_task_started", "scrape_task_completed"]
+
+
+def test_async_sink_groups_queued_events_by_ticket() -> None:
+    class _BatchRecorder:
+        def __init__(self) -> None:
+            self.batches: list[tuple[str, list[str]]] = []
+
+        def log_event(self, ticket_id: str, event: str, payload: dict[str, object]) -> None:
+            self.batches.append((ticket_id, [event]))
+
+        def log_events(self, ticket_id: str, events: list[tuple[str, dict[str, object]]]) -> None:
+            self.batches.append((ticket_id, [event for event, _ in events]))
+
+    inner = _BatchRecorder()
+    sink = AsyncObservationSink(inner=inner)
+
+    for ticket_id, event in [("A", "one"), ("A", "two"), ("B", "three"), ("A", "four")]:
+        sink.log_event(ticket_id, event, {})
+    sink.flush()
+
+    flattened = [(ticket_id, event) for ticket_id, events in inner.batches for event in events]
+    assert flattened == [("A", "one"), ("A", "two"), ("B", "three"), ("A", "four")]
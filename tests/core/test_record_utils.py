@@ -5,6 +5,9 @@ from __future__ import annotations
 from src.core.record_utils import (
     build_record_context,
     extract_candidate_urls,
+    looks_like_url,
+    normalize_url,
+    scan_record,
 )
 
 
@@ -39,3 +42,38 @@ def test_extract_candidate_urls_normalizes_and_deduplicates() -> None:
         "https://example.com",
         "https://facebook.com/cafe",
     ]
+
+
+def test_url_heuristic_rejects_numbers_and_free_text() -> None:
+    assert looks_like_url("WWW.Example.com/Menu")
+    assert not looks_like_url("4.5")
+    assert not looks_like_url("example.")
+    assert not looks_like_url("visit example.com today")
+    assert normalize_url("HTTP://example.com/") == "HTTP://example.com"
+    assert normalize_url("shop.example.com/a") == "https://shop.example.com/a"
+
+
+def test_extract_candidate_urls_skips_non_strings_when_scanning_all_columns() -> None:
+    row = {"RATING": 4.5, "WEBSITE": "example.com", "HOST": b"example.org"}
+
+    assert extract_candidate_urls(row) == ["https://example.com"]
+
+
+def test_scan_record_matches_separate_helpers() -> None:
+    row = {
+        "LOCATION_CITY": "Seattle",
+        "WEBSITE": "example.com",
+        "BUSINESS_NAME": "Cafe Example",
+        "LOCATION_STATE_CODE": "n/a",
+        "RATING": 4.5,
+        "LINK": "https://example.com/",
+    }
+
+    urls, context = scan_record(row)
+
+    assert urls == extract_candidate_urls(row)
+    assert list(context.items()) == list(build_record_context(row).items())
+    assert scan_record(row, ["LINK"], ["WEBSITE"]) == (
+        ["https://example.com"],
+        {"WEBSITE": "example.com"},
+    )
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import json
-
+from collections.abc import Sequence
 from dataclasses import dataclass, field
 from typing import Any
 
@@ -26,10 +26,12 @@ class _SQLExecutorStub(SQLExecutor):
     dataset: dict[str, dict[str, Any]]
     statements: list[str] = field(default_factory=list)
 
-    def run(self, statement: str) -> list[dict[str, Any]]:  # type: ignore[override]
+    def run(  # type: ignore[override]
+        self, statement: str, parameters: Sequence[Any] = ()
+    ) -> list[dict[str, Any]]:
         self.statements.append(statement)
         for record_id, row in self.dataset.items():
-            if record_id in statement:
+            if record_id in parameters:
                 return [row]
         return []
 
@@ -80,7 +82,9 @@ class _UpdateAgentStub:
         }
         self.summaries.append(summary)
         response: dict[str, Any] = {"status": "simulated", "facts": fact_list}
-        unmatched = [fact for fact in fact_list if str(fact.get("concept", ""))[:3].lower() == "new"]
+        unmatched = [
+            fact for fact in fact_list if str(fact.get("concept", ""))[:3].lower() == "new"
+        ]
         if unmatched:
             response["escalated"] = {"unmatched_facts": unmatched}
         return response
@@ -394,7 +398,10 @@ def test_runner_incorporates_scraper_follow_up() -> None:
     assert result.get("fact_sources") == {"employee_count": "https://example.com/report"}
     assert result["scraper_findings"] == 1
     assert updater.summaries and updater.summaries[0]["facts"][0]["value"] == 1200
-    assert result.get("scraper_backfill_prompt") == "Search for 'Cafe Example employees' to refresh employee_count."
+    assert (
+        result.get("scraper_backfill_prompt")
+        == "Search for 'Cafe Example employees' to refresh employee_count."
+    )
     assert flagger.calls, "Query agent should flag missing data before follow-up"
     assert llm.calls, "LLM should be invoked for follow-up synthesis"
 
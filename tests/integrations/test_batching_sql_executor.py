@@ -0,0 +1,53 @@
+"""Tests for the coalescing SQL executor wrapper."""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any
+
+from src.integrations.batching_sql_executor import BatchingSQLExecutor
+
+
+@dataclass
+class _RecordingExecutor:
+    rows: list[dict[str, Any]]
+    calls: list[tuple[str, tuple[Any, ...]]] = field(default_factory=list)
+
+    def run(self, statement: str, parameters: Sequence[Any] = ()) -> list[dict[str, Any]]:
+        self.calls.append((statement, tuple(parameters)))
+        wanted = {str(value) for value in parameters}
+        return [row for row in self.rows if row["BRIZO_ID"] in wanted]
+
+
+def test_concurrent_point_lookups_share_one_query() -> None:
+    inner = _RecordingExecutor(rows=[{"BRIZO_ID": "a"}, {"BRIZO_ID": "b"}])
+    executor = BatchingSQLExecutor(inner=inner, delay_seconds=0.05)
+    statement = executor.point_lookup_statement
+
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        results = list(pool.map(lambda rid: executor.run(statement, (rid,)), ["a", "b", "zz"]))
+
+    assert results == [[{"BRIZO_ID": "a"}], [{"BRIZO_ID": "b"}], []]
+    assert len(inner.calls) == 1
+    sent_statement, sent_ids = inner.calls[0]
+    assert "IN (?, ?, ?)" in sent_statement
+    assert sorted(sent_ids) == ["a", "b", "zz"]
+
+
+def test_full_batch_flushes_without_waiting() -> None:
+    inner = _RecordingExecutor(rows=[{"BRIZO_ID": "a"}])
+    executor = BatchingSQLExecutor(inner=inner, delay_seconds=60, max_batch_size=1)
+
+    assert executor.fetch("a") == {"BRIZO_ID": "a"}
+    assert len(inner.calls) == 1
+
+
+def test_other_statements_pass_through() -> None:
+    inner = _RecordingExecutor(rows=[])
+    executor = BatchingSQLExecutor(inner=inner)
+
+    executor.run("SELECT * FROM dataset WHERE CITY = ?", ("Oakland",))
+
+    assert inner.calls == [("SELECT * FROM dataset WHERE CITY = ?", ("Oakland",))]
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import sys
 from pathlib import Path
 
 import pytest
@@ -48,3 +49,75 @@ def test_invalid_statement_raises(sample_csv: Path) -> None:
 
     with pytest.raises(NotImplementedError):
         executor.run("DELETE FROM records WHERE id = '1'")
+
+
+def test_select_binds_placeholder_parameter(sample_csv: Path) -> None:
+    executor = CsvSQLExecutor(csv_path=sample_csv, table_name="records")
+
+    rows = executor.run("SELECT name FROM records WHERE id = ? LIMIT 1", ("2",))
+
+    assert rows == [{"NAME": "Bravo"}]
+
+
+def test_parameter_count_mismatch_raises(sample_csv: Path) -> None:
+    executor = CsvSQLExecutor(csv_path=sample_csv, table_name="records")
+
+    with pytest.raises(ValueError):
+        executor.run("SELECT * FROM records WHERE id = ?")
+
+
+def test_select_in_list_binds_each_placeholder(sample_csv: Path) -> None:
+    executor = CsvSQLExecutor(csv_path=sample_csv, table_name="records")
+
+    rows = executor.run("SELECT name FROM records WHERE id IN (?, '2')", ("1",))
+
+    assert rows == [{"NAME": "Acme"}, {"NAME": "Bravo"}]
+
+
+def test_row_keys_are_interned_header_names(sample_csv: Path) -> None:
+    executor = CsvSQLExecutor(csv_path=sample_csv, table_name="records")
+
+    row = executor.run("SELECT * FROM records WHERE id = '1'")[0]
+
+    assert all(key is sys.intern(key) for key in row)
+
+
+@pytest.fixture()
+def punctuated_csv(tmp_path: Path) -> Path:
+    content = """ID,NAME
+"a,b",Comma Co
+"x)y",Paren Co
+c,Plain Co
+"""
+    csv_path = tmp_path / "punctuated.csv"
+    csv_path.write_text(content, encoding="utf-8")
+    return csv_path
+
+
+def test_equality_literal_may_contain_comma(punctuated_csv: Path) -> None:
+    executor = CsvSQLExecutor(csv_path=punctuated_csv, table_name="records")
+
+    rows = executor.run("SELECT name FROM records WHERE id = 'a,b' LIMIT 1")
+
+    assert rows == [{"NAME": "Comma Co"}]
+
+
+def test_in_list_literals_may_contain_comma_and_paren(punctuated_csv: Path) -> None:
+    executor = CsvSQLExecutor(csv_path=punctuated_csv, table_name="records")
+
+    rows = executor.run("SELECT name FROM records WHERE id IN ('x)y', 'a,b', ?)", ("c",))
+
+    assert rows == [{"NAME": "Comma Co"}, {"NAME": "Paren Co"}, {"NAME": "Plain Co"}]
+
+
+def test_malformed_in_list_raises(sample_csv: Path) -> None:
+    executor = CsvSQLExecutor(csv_path=sample_csv, table_name="records")
+
+    for statement in (
+        "SELECT * FROM records WHERE id IN ()",
+        "SELECT * FROM records WHERE id IN ('1',)",
+        "SELECT * FROM records WHERE id IN ('1' '2')",
+        "SELECT * FROM records WHERE id IN (1)",
+    ):
+        with pytest.raises(NotImplementedError):
+            executor.run(statement)
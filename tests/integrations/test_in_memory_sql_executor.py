@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import pytest
+
 from src.integrations.in_memory_sql_executor import InMemorySQLExecutor
 
 
@@ -29,3 +31,26 @@ def test_prime_adds_new_statement() -> None:
     executor.prime("SELECT * FROM leads", [{"id": "L1"}])
 
     assert executor.run("SELECT * FROM leads") == [{"id": "L1"}]
+
+
+def test_run_renders_bound_parameters() -> None:
+    executor = InMemorySQLExecutor()
+
+    executor.prime("SELECT * FROM leads WHERE id = 'O''Neil'", [{"id": "O'Neil"}])
+
+    assert executor.run("SELECT * FROM leads WHERE id = ?", ("O'Neil",)) == [{"id": "O'Neil"}]
+
+
+def test_run_keeps_placeholders_inside_bound_values() -> None:
+    executor = InMemorySQLExecutor()
+
+    executor.prime("SELECT * FROM leads WHERE a = 'x?' AND b = 'y'", [{"id": "L2"}])
+
+    assert executor.run("SELECT * FROM leads WHERE a = ? AND b = ?", ("x?", "y")) == [{"id": "L2"}]
+
+
+def test_run_rejects_parameter_count_mismatch() -> None:
+    executor = InMemorySQLExecutor()
+
+    with pytest.raises(ValueError, match="expects 2 parameter"):
+        executor.run("SELECT * FROM leads WHERE a = ? AND b = ?", ("x",))